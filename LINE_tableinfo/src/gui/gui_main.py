@@ -65,7 +65,7 @@ Requirements:
 - tkinter
 - sqlite3
 - PIL (Python Imaging Library)
-- pandas (for Excel export)
+- xlsxwriter (for Excel export)
 
 Author: R/Y
 Version: 2.0.0
@@ -139,7 +139,7 @@ LINE データベースビューアー
 - tkinter
 - sqlite3
 - PIL（Python Imaging Library）
-- pandas（Excelエクスポート用）
+- xlsxwriter（Excelエクスポート用）
 
 作者：R/Y
 バージョン：2.0.0
@@ -151,14 +151,25 @@ from tkinter import ttk
 from tkinter import scrolledtext
 from tkinter import messagebox
 from tkinter import filedialog
+from tkinter import font as tkfont
 import sqlite3
 import os
-from typing import Optional, List, Tuple, Dict, Any
+import re
+import time
+from typing import Optional, List, Tuple, Dict, Any, Callable
 import sys
 from pathlib import Path
 import json
 import io
-from PIL import Image, ImageTk
+import hashlib
+import queue
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial, lru_cache
+from itertools import chain
+from operator import itemgetter
 
 # Add the parent directory to sys.path
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -167,13 +178,48 @@ from src.utils.database_utils import (
     connect_database,
     get_all_tables,
     get_table_info,
+    get_table_xinfo,
+    get_column_samples,
     get_table_row_count,
+    get_table_row_counts,
     get_table_contents,
     get_table_contents_with_wal,
-    check_deleted_messages
+    check_deleted_messages,
+    build_search_index,
+    search_index,
+    estimate_table_row_counts,
+    load_row_count_cache,
+    save_row_count_cache,
+    SEARCH_INDEX_MIN_LENGTH
 )
-from src.utils.time_utils import convert_timestamp
+from src.utils.time_utils import convert_timestamp, convert_timestamps, parse_timestamp, format_timestamp
 from src.utils.export_utils import export_to_excel
+from src.utils.hex_utils import hex_dump_lines
+from src.utils.image_utils import detect_image_type
+
+@lru_cache(maxsize=None)
+def _get_pil():
+    """
+    GetPIL
+    Pillowを初回使用時に読み込む（起動時間短縮のため、画像表示まで読み込まない）
+
+    Returns:
+        Tuple[module, module]: (PIL.Image, PIL.ImageTk)
+    """
+    from PIL import Image, ImageTk
+    return Image, ImageTk
+
+def _close_db(conn: sqlite3.Connection, cursor: sqlite3.Cursor):
+    """
+    CloseDB
+    データベース接続を閉じる（weakref.finalize から呼ばれるため、ビューアへの参照を持たない）
+
+    Args:
+        conn (sqlite3.Connection): 閉じる接続
+        cursor (sqlite3.Cursor): 閉じるカーソル
+    """
+    cursor.close()
+    conn.close()
 
 class TimeFormatMenu(tk.Menu):
     """
@@ -181,6 +227,31 @@ class TimeFormatMenu(tk.Menu):
     タイムスタンプ表示形式GUI
     """
 
+    # メニュー項目（表示名, 形式）。Noneは区切り線
+    _ENTRIES = (
+        # 日本時間関連
+        ("JST (日本時間)", "JST"),
+        None,
+        # UNIXタイムスタンプ関連
+        ("UNIX_microsecond (マイクロ秒)", "UNIX_microsecond"),
+        ("UNIX_millisecond (ミリ秒)", "UNIX_millisecond"),
+        ("UNIX_second (秒)", "UNIX_second"),
+        None,
+        # プラットフォーム固有
+        ("MAC (HFS+)", "MAC"),
+        ("COCOA", "COCOA"),
+        ("FILETIME (Windows)", "FILETIME"),
+        None,
+        # Webブラウザ関連
+        ("WebKit", "WEBKIT"),
+        ("Chrome (WebKit)", "CHROME"),
+        ("Firefox", "FIREFOX"),
+        None,
+        # その他のタイムゾーン
+        ("UTC (世界協定時)", "UTC"),
+        ("GMT (グリニッジ標準時)", "GMT"),
+    )
+
     def __init__(self, parent: tk.Widget, column_name: str, callback: callable):
         """
         Args:
@@ -191,68 +262,13 @@ class TimeFormatMenu(tk.Menu):
         super().__init__(parent, tearoff=0)
         self.callback = callback
         self.column_name = column_name
-        
-        # 日本時間関連
-        self.add_command(
-            label="JST (日本時間)", 
-            command=lambda: self.callback(column_name, "JST")
-        )
-        self.add_separator()
-        
-        # UNIXタイムスタンプ関連
-        self.add_command(
-            label="UNIX_microsecond (マイクロ秒)", 
-            command=lambda: self.callback(column_name, "UNIX_microsecond")
-        )
-        self.add_command(
-            label="UNIX_millisecond (ミリ秒)", 
-            command=lambda: self.callback(column_name, "UNIX_millisecond")
-        )
-        self.add_command(
-            label="UNIX_second (秒)", 
-            command=lambda: self.callback(column_name, "UNIX_second")
-        )
-        self.add_separator()
-        
-        # プラットフォーム固有
-        self.add_command(
-            label="MAC (HFS+)", 
-            command=lambda: self.callback(column_name, "MAC")
-        )
-        self.add_command(
-            label="COCOA", 
-            command=lambda: self.callback(column_name, "COCOA")
-        )
-        self.add_command(
-            label="FILETIME (Windows)", 
-            command=lambda: self.callback(column_name, "FILETIME")
-        )
-        self.add_separator()
-        
-        # Webブラウザ関連
-        self.add_command(
-            label="WebKit", 
-            command=lambda: self.callback(column_name, "WEBKIT")
-        )
-        self.add_command(
-            label="Chrome (WebKit)", 
-            command=lambda: self.callback(column_name, "CHROME")
-        )
-        self.add_command(
-            label="Firefox", 
-            command=lambda: self.callback(column_name, "FIREFOX")
-        )
-        self.add_separator()
-        
-        # その他のタイムゾーン
-        self.add_command(
-            label="UTC (世界協定時)", 
-            command=lambda: self.callback(column_name, "UTC")
-        )
-        self.add_command(
-            label="GMT (グリニッジ標準時)", 
-            command=lambda: self.callback(column_name, "GMT")
-        )
+
+        for entry in self._ENTRIES:
+            if entry is None:
+                self.add_separator()
+            else:
+                label, format_type = entry
+                self.add_command(label=label, command=partial(callback, column_name, format_type))
 
 class LineDBViewer(tk.Tk):
     """
@@ -262,6 +278,101 @@ class LineDBViewer(tk.Tk):
     
     """
 
+    # 仮想スクロール設定
+    WINDOW_SIZE = 500        # ツリービューに展開する最大行数
+    CHUNK_SIZE = 250         # 表示用変換を行う単位（行数）
+    WINDOW_CACHE_SIZE = 8    # 変換済みチャンクのキャッシュ数
+
+    # HEX表示の上限（バイト数、「全て表示」で解除）
+    HEX_DISPLAY_LIMIT = 64 * 1024
+    # HEXダンプを一度に描画する行数（続きはスクロールが末尾に近づいたときに描画）
+    HEX_RENDER_LINES = 512
+
+    # テキスト解析（行数・文字種別）で調べる先頭の文字数
+    TEXT_PROBE_SIZE = 64 * 1024
+
+    # 画像プレビュー（縮小済みPhotoImage）のキャッシュ数
+    IMAGE_CACHE_SIZE = 64
+
+    # 行のタグの組み合わせ（行ごとにリストを作らず、共有のタプルを使う）
+    # インデックスは 奇数行=1、WALレコード=2、検索結果=4 の和
+    ROW_TAG_SETS = tuple(
+        (('oddrow',) if n & 1 else ('evenrow',))
+        + (('wal_record',) if n & 2 else ())
+        + (('search_result',) if n & 4 else ())
+        for n in range(8)
+    )
+
+    # 検索条件ごとの比較関数（引数は (セルの値, 検索文字列)、該当しない条件は「含む」）
+    SEARCH_MATCHERS = {
+        "完全一致": str.__eq__,
+        "前方一致": str.startswith,
+        "後方一致": str.endswith,
+    }
+
+    # タイムスタンプのカラム名に含まれるキーワード
+    TIMESTAMP_KEYWORDS = (
+        # 一般的なタイムスタンプキーワード
+        'TIMESTAMP',
+        'TIME',
+        'DATE',
+        # 作成・更新関連
+        'CREATED',
+        'MODIFIED',
+        'UPDATED',
+        'LAST_UPDATED',
+        'LAST_MODIFIED',
+        'CREATE_TIME',
+        'UPDATE_TIME',
+        'MOD_TIME',
+        # LINE特有のプレフィックス
+        'Z_TIMESTAMP',
+        'ZLASTUPDATE',
+        'ZLASTMODIFIED',
+        'ZCREATEDAT',
+        'ZUPDATEDAT',
+        # その他の一般的な表現
+        'DATETIME',
+        'POSTED_AT',
+        'SENT_AT',
+        'RECEIVED_AT',
+        'DELIVERED_AT',
+        'READ_AT',
+        'ACCESSED_AT',
+        'LOGGED_AT',
+        # 日付関連
+        'BIRTH',
+        'DEATH',
+        'START',
+        'END',
+        'EXPIRE',
+        'DEADLINE'
+    )
+
+    # キーワードを1つの正規表現にまとめたもの（長いキーワードを優先して照合）
+    TIMESTAMP_PATTERN = re.compile(
+        '|'.join(map(re.escape, sorted(TIMESTAMP_KEYWORDS, key=len, reverse=True))),
+        re.IGNORECASE
+    )
+
+    # 16進文字列の判定用（空白を除いてから照合する）
+    HEX_STRING_PATTERN = re.compile(r'[0-9A-Fa-f]*')
+    WHITESPACE_DELETE = str.maketrans('', '', ' \t\r\n')
+
+    # データベースを開く処理の段階（進捗表示用）
+    OPEN_STAGES = (
+        "Opening database...",
+        "Listing tables...",
+        "Counting rows...",
+    )
+
+    # バックグラウンドで正確な行数を数える際の1回の処理のテーブル数
+    # （処理の間にテーブル選択などの操作が割り込めるよう、ワーカースレッドへ少しずつ登録する）
+    ROW_COUNT_JOB_TABLES = 16
+
+    # テーブル行数キャッシュの保存先
+    ROW_COUNT_CACHE_PATH = str(Path(__file__).parent.parent.parent / "row_count_cache.json")
+
     def __init__(self):
         """
         Main window initialization
@@ -273,58 +384,349 @@ class LineDBViewer(tk.Tk):
         self.geometry("1200x800")
 
         # WALデータ関連の初期化
-        self.wal_records = set()  # WALのみに存在するレコードのキー
+        self.wal_records = set()  # WALのみに存在するレコードの行番号
         
         # 時間表示モードの初期化
         self.time_display_modes: Dict[str, str] = {}
         
-        # オリジナル値保存用の辞書
-        self.original_values_cache: Dict[str, Dict[str, str]] = {}
-        
         # データベース接続情報の初期化
         self.conn: Optional[sqlite3.Connection] = None
         self.cursor: Optional[sqlite3.Cursor] = None
         self.current_db_path: Optional[str] = None
+        # self.cursor で開いているDBのパス（ワーカースレッドで self.cursor と同時に更新する）
+        # current_db_path はメインスレッドで開き終わった時点に更新されるため、
+        # ワーカースレッドでの処理はこちらと比較する
+        self._opened_db_path: Optional[str] = None
+        # 接続のクローズ処理（ビューアの破棄時・終了時に未実行なら呼ばれる）
+        self._db_finalizer: Optional[weakref.finalize] = None
+
+        # テーブル一覧と行数（exact_row_tablesに含まれないテーブルの行数は推定値）
+        self.tables: List[str] = []
+        self.table_rows: Dict[str, int] = {}
+        self.exact_row_tables: set = set()
+
+        # テーブル一覧（リストボックスの表示位置に対応するテーブル名）
+        self._table_names: List[str] = []
+
+        # テーブル行数キャッシュ（DBのパスごとに更新時刻と行数を保持。ワーカースレッドでのみ更新）
+        self._row_count_cache: Dict[str, Dict[str, Any]] = load_row_count_cache(self.ROW_COUNT_CACHE_PATH)
+
+        # 進捗表示ウィンドウ
+        self._progress_window: Optional[tk.Toplevel] = None
+        self._progress_label: Optional[ttk.Label] = None
+        self._progress_bar: Optional[ttk.Progressbar] = None
+
+        # DB処理用ワーカースレッド（SQLite接続はこのスレッドで開き、このスレッドでのみ使用）
+        self._db_queue: queue.Queue = queue.Queue()
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._db_thread = threading.Thread(target=self._db_worker, daemon=True)
+        self._db_thread.start()
+
+        # 表示中テーブルのデータ（仮想スクロールの行ソース）
+        self.current_data: List[Any] = []
+        self.current_columns: List[str] = []
+
+        # 表示中テーブルのタイムスタンプカラム（テーブル読み込み時に1回だけ判定）
+        self._ts_cols: frozenset = frozenset()
+        self._ts_col_indices: Tuple[int, ...] = ()
+
+        # カラム名ごとのタイムスタンプ判定結果（判定はカラム名のみで決まるため保持し続ける）
+        self._ts_col_cache: Dict[str, bool] = {}
+
+        # タイムスタンプカラムごとの表示形式メニュー（テーブル読み込み時に作成して再利用）
+        self._tf_menus: Dict[str, TimeFormatMenu] = {}
+
+        # 仮想スクロールの状態（ツリービューに展開中の行範囲と変換済みチャンクのキャッシュ）
+        self._window_start = 0
+        self._window_end = 0
+        self._window_cache: "OrderedDict[int, List[list]]" = OrderedDict()
+        self._window_shift_pending = False
+
+        # 縮小済み画像のキャッシュ（キー: (画像データのハッシュ, 最大サイズ)）
+        self._img_cache: "OrderedDict[Tuple[bytes, Tuple[int, int]], Tuple[ImageTk.PhotoImage, Tuple[int, int], str]]" = OrderedDict()
+        # 最後にハッシュを求めた画像データとそのハッシュ（表示モードの切り替え時に再計算しない）
+        self._img_last_digest: Tuple[Optional[bytes], bytes] = (None, b'')
+        # 画像のデコード・縮小用スレッド（PhotoImageの作成はTkメインスレッドで行う）
+        self._preview_executor = ThreadPoolExecutor(max_workers=1)
+        self._preview_future: Optional[Future] = None
+        self._preview_gen = 0
+
+        # 最後にクリックで選択した行（ハイライトの解除用）
+        self._last_sel_item: Optional[str] = None
+
+        # 検索結果の行番号
+        self._search_matches: set = set()
+
+        # 全文検索インデックス（ワーカースレッドで作成・検索する）
+        self._search_index: Optional[sqlite3.Connection] = None
+        self._search_index_gen = 0
+
+        # 検索用に文字列化した行（キー: 小文字化したかどうか、表示中のテーブルごとに作成）
+        self._search_strings: Dict[bool, List[Tuple[Optional[str], ...]]] = {}
+
+        # 入力中の検索（デバウンス用のafter IDと、古い検索結果を破棄するための世代番号）
+        self._search_after: Optional[str] = None
+        self._search_gen = 0
+
+        # テーブル表示後に予約したテーブル分析（after_idleのID）
+        self._analysis_after: Optional[str] = None
+
+        # 詳細表示する値（カラム名, 値, iid, データタイプ）と、未更新の詳細タブ
+        # 表示中のタブのみ更新し、他のタブは切り替えた時点で更新する
+        self._pending_detail: Optional[Tuple[str, Any, str, str]] = None
+        self._dirty_detail_tabs: set = set()
+
+        # HEXダンプの段階描画（描画対象のデータ・描画済みのバイト数・元データのサイズ・予約した描画のafter ID）
+        self._hex_render_data: bytes = b''
+        self._hex_render_offset = 0
+        self._hex_render_total = 0
+        self._hex_render_after: Optional[str] = None
         
         # UIの作成
+        self._configure_styles()
         self.create_widgets()
-        self.current_data: List[Any] = []
         
         # ツリービューのタグを設定
         self._configure_tree_tags()
 
-    def connect_database(self, db_path: Optional[str] = None) -> bool:
+    def _db_worker(self):
+        """
+        DBWorker
+        DB処理専用のワーカースレッド
+
+        キューに登録された処理を順番に実行し、結果をTkメインスレッドへ通知する。
+        """
+        while True:
+            job = self._db_queue.get()
+            if job is None:
+                break
+            fn, args, on_done, on_error = job
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if on_error:
+                    self._post_to_ui(on_error, e)
+                else:
+                    print(f"DB worker error: {e}")
+            else:
+                if on_done:
+                    self._post_to_ui(on_done, result)
+
+    def _submit(self, fn: Callable, *args,
+                on_done: Optional[Callable] = None,
+                on_error: Optional[Callable] = None):
+        """
+        SubmitDBJob
+        DB処理をワーカースレッドに登録
+
+        Args:
+            fn (Callable): ワーカースレッドで実行する関数
+            on_done (Optional[Callable]): 完了時にメインスレッドで呼ばれるコールバック（引数: 戻り値）
+            on_error (Optional[Callable]): 例外時にメインスレッドで呼ばれるコールバック（引数: 例外）
+        """
+        self._db_queue.put((fn, args, on_done, on_error))
+
+    def _post_to_ui(self, callback: Callable, *args):
+        """
+        PostToUI
+        コールバックをTkメインスレッドで実行するよう登録（ワーカースレッドから呼び出す）
+        """
+        self._ui_queue.put((callback, args))
+        try:
+            # メインループを起こす（ポーリングはしない）
+            self.after(0, self._drain_ui_queue)
+        except RuntimeError:
+            pass  # メインループ終了後は無視
+
+    def _drain_ui_queue(self):
+        """
+        DrainUIQueue
+        ワーカースレッドからの完了通知をまとめて処理
+        """
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+
+    def connect_database(self, db_path: Optional[str] = None,
+                         on_done: Optional[Callable[[bool], None]] = None):
         """
         　　Connect to the database
-            データベースに接続
+            データベースに接続（ワーカースレッドで実行）
 
         Args:
             db_path (Optional[str]): DB_pathデータベースファイルのパス
-
-        Returns:
-            bool: 接続成功の場合:True
+            on_done (Optional[Callable[[bool], None]]): 完了時のコールバック（接続成功の場合:True）
         """
-        if db_path:
-            # 既存の接続を閉じる
-            if self.conn:
-                self.cursor.close()
-                self.conn.close()
-            
-            # 新しい接続を作成
-            self.conn, self.cursor = connect_database(db_path)
-            if self.conn and self.cursor:
+        if not db_path:
+            return
+
+        counting_text = "Counting rows/行数を集計中..."
+
+        def on_opened(result: Optional[Tuple[List[str], Dict[str, int], set]]):
+            if result is not None:
                 self.current_db_path = db_path
-                
-                # テーブル一覧を更新
-                self.tables = get_all_tables(self.cursor)
-                self.table_rows = {}
-                for table in self.tables:
-                    self.table_rows[table] = get_table_row_count(self.cursor, table)
-                
+                self.tables, self.table_rows, self.exact_row_tables = result
+
                 # テーブルリストを更新
                 self.update_table_list()
-                return True
-            return False
+
+                # 推定値のテーブルは、正確な行数をバックグラウンドで少しずつ取得
+                pending = [table for table in self.tables if table not in self.exact_row_tables]
+                if pending:
+                    self.update_status(counting_text)
+                    count_next(db_path, pending)
+            if on_done:
+                on_done(result is not None)
+
+        def count_next(counted_path: str, pending: List[str]):
+            # 次の数テーブル分のみ登録し、完了後に残りを登録する
+            # （その間に登録されたテーブル選択などの処理は、全テーブルの集計を待たずに実行される）
+            batch, rest = pending[:self.ROW_COUNT_JOB_TABLES], pending[self.ROW_COUNT_JOB_TABLES:]
+            self._submit(self._count_all_table_rows, counted_path, batch,
+                         on_done=lambda counts: on_counted(counted_path, counts, rest))
+
+        def on_counted(counted_path: str, counts: Dict[str, int], rest: List[str]):
+            if counted_path != self.current_db_path:
+                return  # 別のDBを開いた後の結果は破棄
+            self.table_rows.update(counts)
+            self.exact_row_tables.update(counts)
+
+            # 選択状態を維持したまま表示を更新
+            selection = self.table_listbox.curselection()
+            self.update_table_list()
+            for index in selection:
+                self.table_listbox.selection_set(index)
+
+            if rest:
+                count_next(counted_path, rest)
+            elif self.status_label.cget("text") == counting_text:
+                self.update_status("")
+
+        def on_error(e: Exception):
+            print(f"Database connection error: {e}")
+            if on_done:
+                on_done(False)
+
+        def on_stage(stage: int):
+            self._set_progress(stage, self.OPEN_STAGES[stage])
+
+        self._submit(self._open_database, db_path,
+                     lambda stage: self._post_to_ui(on_stage, stage),
+                     on_done=on_opened, on_error=on_error)
+
+    def _open_database(self, db_path: str,
+                       progress_callback: Optional[Callable[[int], None]] = None
+                       ) -> Optional[Tuple[List[str], Dict[str, int], set]]:
+        """
+        OpenDatabase (worker thread)
+        DBを開き、テーブル一覧と行数を取得（ワーカースレッドで実行）
+
+        各段階（OPEN_STAGESの番号）の開始時にprogress_callbackを呼び出す。
+
+        行数は (パス, 更新時刻) が一致すればキャッシュから取得し、
+        一致しない場合は max(rowid) による推定値を1回のクエリで取得する。
+        正確な行数は、DBを開いた後に _count_all_table_rows() で ROW_COUNT_JOB_TABLES
+        テーブルずつバックグラウンドで取得する（選択したテーブルは _count_table_rows() で先に取得）。
+
+        Returns:
+            Optional[Tuple[List[str], Dict[str, int], set]]:
+                (テーブル一覧, テーブルごとの行数, 正確な行数のテーブル名)。失敗時はNone
+        """
+        def report(stage: int):
+            if progress_callback:
+                progress_callback(stage)
+
+        # 既存の接続を閉じる
+        report(0)
+        if self._db_finalizer:
+            self._db_finalizer()
+            self._db_finalizer = None
+            self.conn, self.cursor = None, None
+            self._opened_db_path = None
+
+        # 新しい接続を作成（解析対象のファイルを変更しないよう読み取り専用）
+        conn, cursor = connect_database(db_path, check_same_thread=False, read_only=True)
+        if not (conn and cursor):
+            return None
+        self.conn, self.cursor = conn, cursor
+        self._opened_db_path = db_path
+        self._db_finalizer = weakref.finalize(self, _close_db, conn, cursor)
+
+        # テーブル一覧を取得
+        report(1)
+        tables = get_all_tables(self.cursor)
+
+        # 行数はキャッシュを優先し、なければ推定値を取得
+        report(2)
+        entry = self._row_count_cache.get(db_path)
+        mtime = self._get_db_mtime(db_path)
+        if entry and entry.get("mtime") == mtime and set(entry.get("counts", {})) >= set(tables):
+            return tables, dict(entry["counts"]), set(entry.get("exact", []))
+
+        table_rows = estimate_table_row_counts(self.cursor, tables)
+        self._row_count_cache[db_path] = {"mtime": mtime, "counts": table_rows, "exact": []}
+        save_row_count_cache(self.ROW_COUNT_CACHE_PATH, self._row_count_cache)
+        return tables, dict(table_rows), set()
+
+    def _count_all_table_rows(self, db_path: str, tables: List[str]) -> Dict[str, int]:
+        """
+        CountAllTableRows (worker thread)
+        指定したテーブルの正確な行数を1回のクエリで取得し、行数キャッシュを更新（ワーカースレッドで実行）
+
+        Args:
+            db_path (str): 集計を開始した時点のDBのパス（別のDBを開いた後は何もしない）
+            tables (List[str]): 行数を数えるテーブル名のリスト
+        """
+        # 集計の途中で別のDBを開いた場合は、そのDBの行数を元のDBのキャッシュに書き込まない
+        entry = self._row_count_cache.get(db_path)
+        if db_path != self._opened_db_path or self.cursor is None or not entry:
+            return {}
+
+        # テーブル選択時に数え終わったテーブルは数え直さない
+        exact = entry.setdefault("exact", [])
+        tables = [table for table in tables if table not in exact]
+        if not tables:
+            return {}
+        counts = get_table_row_counts(self.cursor, tables)
+        entry["counts"].update(counts)
+        exact.extend(counts)
+        save_row_count_cache(self.ROW_COUNT_CACHE_PATH, self._row_count_cache)
+        return counts
+
+    def _count_table_rows(self, table_name: str) -> int:
+        """
+        CountTableRows (worker thread)
+        テーブルの正確な行数を取得し、行数キャッシュを更新（ワーカースレッドで実行）
+        """
+        # self.cursor のDBのキャッシュを使う（current_db_path は別のDBを開く途中で古い場合がある）
+        db_path = self._opened_db_path
+        entry = self._row_count_cache.get(db_path)
+        if entry and entry.get("mtime") == self._get_db_mtime(db_path) \
+                and table_name in entry.get("exact", []):
+            return entry["counts"][table_name]
+
+        row_count = get_table_row_count(self.cursor, table_name)
+        if entry:
+            entry["counts"][table_name] = row_count
+            if table_name not in entry["exact"]:
+                entry["exact"].append(table_name)
+            save_row_count_cache(self.ROW_COUNT_CACHE_PATH, self._row_count_cache)
+        return row_count
+
+    @staticmethod
+    def _get_db_mtime(db_path: str) -> float:
+        """
+        GetDBMtime
+        DBファイルの更新時刻を取得（WALファイルがある場合は新しい方）
+        """
+        mtime = os.path.getmtime(db_path)
+        wal_path = db_path + "-wal"
+        if os.path.exists(wal_path):
+            mtime = max(mtime, os.path.getmtime(wal_path))
+        return mtime
 
     def create_widgets(self):
         """
@@ -377,8 +779,7 @@ class LineDBViewer(tk.Tk):
         ttk.Button(db_section, text="SelectDB/データベースの選択", 
                   command=self.select_database).pack(fill=tk.X, padx=5, pady=5)
         
-        self.db_path_label = ttk.Label(db_section, text="CurrentDB/表示中DB: None", 
-                                     wraplength=280)
+        self.db_path_label = ttk.Label(db_section, text="CurrentDB/表示中DB: None")
         self.db_path_label.pack(fill=tk.X, padx=5, pady=(0, 5))
 
     def _create_table_list_section(self, parent: ttk.Frame):
@@ -529,7 +930,7 @@ class LineDBViewer(tk.Tk):
 
         # 検索エントリーにバインド
         self.search_entry.bind('<Return>', lambda e: self._perform_search())
-        self.search_entry.bind('<KeyRelease>', lambda e: self._perform_search())
+        self.search_entry.bind('<KeyRelease>', lambda e: self._schedule_search())
 
     def _create_table_view_section(self, parent: ttk.Frame):
         """
@@ -539,28 +940,6 @@ class LineDBViewer(tk.Tk):
         table_view_section = ttk.LabelFrame(parent, text="TableViewテーブル内容")
         table_view_section.pack(fill=tk.BOTH, expand=True)
 
-        # スタイルの設定
-        style = ttk.Style()
-        style.configure("Treeview", 
-                       rowheight=25,            # 行の高さ
-                       borderwidth=1,           # ボーダー幅
-                       relief="solid",          # ボーダーのスタイル
-                       font=('TkDefaultFont', 10))  # フォント設定
-        
-        # ヘッダーのスタイル設定
-        style.configure("Treeview.Heading",
-                       borderwidth=1,           # ヘッダーのボーダー幅
-                       relief="solid",          # ヘッダーのボーダースタイル
-                       font=('TkDefaultFont', 10, 'bold'),  # ヘッダーのフォント
-                       background="SystemButtonFace",  # ヘッダーの背景色
-                       foreground="black")      # ヘッダーのテキスト色
-        
-        # グリッド線の色を設定
-        style.configure("Treeview", 
-                       background="white",      # 背景色
-                       fieldbackground="white", # フィールドの背景色
-                       foreground="black")      # テキストの色
-
         # 水平方向に分割するPanedWindow
         h_paned = ttk.PanedWindow(table_view_section, orient=tk.HORIZONTAL)
         h_paned.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -570,8 +949,8 @@ class LineDBViewer(tk.Tk):
         h_paned.add(tree_frame, weight=3)  # 幅の比率を3に設定
 
         # ツリービューのスクロールバー
-        tree_y_scrollbar = ttk.Scrollbar(tree_frame)
-        tree_y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree_y_scrollbar = ttk.Scrollbar(tree_frame)
+        self.tree_y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         tree_x_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
         tree_x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
@@ -579,7 +958,7 @@ class LineDBViewer(tk.Tk):
         # ツリービュー
         self.tree = ttk.Treeview(
             tree_frame,
-            yscrollcommand=tree_y_scrollbar.set,
+            yscrollcommand=self._on_tree_yscroll,  # 仮想スクロール位置に変換
             xscrollcommand=tree_x_scrollbar.set,
             selectmode='browse',  # 1行のみ選択可能
             style="Treeview"     # スタイルを適用
@@ -589,7 +968,7 @@ class LineDBViewer(tk.Tk):
         # グリッド線を表示（show="tree headings"にすると縦線も表示）
         self.tree["show"] = "headings"  # ヘッダーのみ表示（左の階層ツリーは非表示）
 
-        tree_y_scrollbar.config(command=self.tree.yview)
+        self.tree_y_scrollbar.config(command=self._on_tree_yview)
         tree_x_scrollbar.config(command=self.tree.xview)
 
         # 詳細表示用フレーム（右側）
@@ -599,6 +978,7 @@ class LineDBViewer(tk.Tk):
         # タブコントロールの作成
         self.detail_notebook = ttk.Notebook(detail_frame)
         self.detail_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.detail_notebook.bind('<<NotebookTabChanged>>', lambda e: self._refresh_active_detail_tab())
 
         # 基本情報タブ
         self.basic_detail_frame = ttk.Frame(self.detail_notebook)
@@ -623,6 +1003,7 @@ class LineDBViewer(tk.Tk):
                 "binary": "バイナリ解析", 
                 "json": "JSON解析",
                 "timestamp": "タイムスタンプ解析",
+                "number": "数値解析",
                 "text": "テキスト解析"
             }
             tab_name = tab_names.get(data_type, "拡張情報")
@@ -638,10 +1019,24 @@ class LineDBViewer(tk.Tk):
         )
         self.extended_detail_text.pack(fill=tk.BOTH, expand=True)
 
+        # バイナリ解析の「全て表示」リンク（HEX表示タブで全体を表示）
+        self.extended_detail_text.tag_bind('link', '<Button-1>', lambda e: self._show_full_hex())
+
         # HEX表示タブ
         self.hex_detail_frame = ttk.Frame(self.detail_notebook)
         self.detail_notebook.add(self.hex_detail_frame, text='HEX/HEX表示')
         
+        # 表示切替ボタン（大きなデータは先頭のみ表示）
+        hex_button_frame = ttk.Frame(self.hex_detail_frame)
+        hex_button_frame.pack(fill=tk.X, padx=5, pady=2)
+        self.show_full_hex_var = tk.BooleanVar(value=False)
+        self.toggle_hex_button = ttk.Button(
+            hex_button_frame,
+            text="ShowAll/全て表示",
+            command=self._toggle_hex_display
+        )
+        self.toggle_hex_button.pack(side=tk.LEFT)
+
         # HEX表示用のテキストエリア
         self.hex_detail_text = scrolledtext.ScrolledText(
             self.hex_detail_frame,
@@ -651,6 +1046,12 @@ class LineDBViewer(tk.Tk):
             font=('Courier', 9)  # 等幅フォントを使用
         )
         self.hex_detail_text.pack(fill=tk.BOTH, expand=True)
+        # スクロール位置が末尾に近づいたらHEXダンプの続きを描画する
+        self.hex_detail_text.config(yscrollcommand=self._on_hex_scroll)
+
+        # 詳細表示のタグスタイルは作成時に1回だけ設定（タグは内容を削除しても保持される）
+        for text_widget in (self.detail_text, self.extended_detail_text, self.hex_detail_text):
+            self._apply_text_styles(text_widget)
 
         # 画像表示タブ
         self.image_detail_frame = ttk.Frame(self.detail_notebook)
@@ -686,7 +1087,6 @@ class LineDBViewer(tk.Tk):
         self.image_info_label = ttk.Label(
             image_display_frame,
             text="",
-            wraplength=280,
             justify=tk.LEFT
         )
         self.image_info_label.pack(fill=tk.X, padx=5, pady=5)
@@ -711,26 +1111,79 @@ class LineDBViewer(tk.Tk):
             ]
         )
         if file_path:
-            if self.connect_database(file_path):
-                # Show progress bar
-                progress_window = tk.Toplevel(self)
-                progress_window.title("Loading")
-                progress_window.geometry("300x50")
-                progress_window.transient(self)
-                progress_window.grab_set()
-                
-                progress_label = ttk.Label(progress_window, text="Loading database...")
-                progress_label.pack(pady=(5,0))
-                progress_bar = ttk.Progressbar(progress_window, mode='indeterminate')
-                progress_bar.pack(fill=tk.X, padx=20, pady=5)
-                progress_bar.start(10)
-                
-                progress_window.update()
-                progress_window.destroy()
-                
-                self.db_path_label.config(text=f"CurrentDB/表示中DB: {os.path.basename(file_path)}")
-            else:
-                messagebox.showerror("Error", "Failed to load database")
+            # Show progress bar（接続はワーカースレッドで行うため、完了まで表示される）
+            self._open_progress_window("Loading", "Opening database...", "300x80",
+                                       maximum=len(self.OPEN_STAGES))
+
+            def on_connected(ok: bool):
+                self._close_progress_window()
+                if ok:
+                    self.db_path_label.config(
+                        text=f"CurrentDB/表示中DB: {self._elide(os.path.basename(file_path))}")
+                else:
+                    messagebox.showerror("Error", "Failed to load database")
+
+            self.connect_database(file_path, on_done=on_connected)
+
+    @staticmethod
+    def _elide(text: str, width: int = 40) -> str:
+        """
+        Elide
+        長い文字列を末尾のwidth文字に省略（ラベルの折り返し計算を避けるため）
+        """
+        return text if len(text) <= width else "…" + text[-width:]
+
+    def _open_progress_window(self, title: str, text: str, geometry: str = "400x80",
+                              maximum: Optional[int] = None):
+        """
+        OpenProgressWindow
+        進捗表示ウィンドウを表示
+
+        Args:
+            maximum (Optional[int]): 段階数（指定した場合は_set_progress()で進める確定表示、
+                Noneの場合は不確定表示）
+        """
+        self._close_progress_window()
+
+        progress_window = tk.Toplevel(self)
+        progress_window.title(title)
+        progress_window.geometry(geometry)
+        progress_window.transient(self)
+        progress_window.grab_set()
+
+        progress_label = ttk.Label(progress_window, text=text)
+        progress_label.pack(pady=(5, 0))
+        if maximum is None:
+            progress_bar = ttk.Progressbar(progress_window, mode='indeterminate')
+            progress_bar.start(10)
+        else:
+            progress_bar = ttk.Progressbar(progress_window, mode='determinate', maximum=maximum)
+        progress_bar.pack(fill=tk.X, padx=20, pady=5)
+
+        self._progress_window = progress_window
+        self._progress_label = progress_label
+        self._progress_bar = progress_bar
+
+    def _set_progress(self, value: int, text: str):
+        """
+        SetProgress
+        進捗表示ウィンドウの段階と表示文字列を更新
+        """
+        if self._progress_window is None:
+            return
+        self._progress_bar.config(value=value)
+        self._progress_label.config(text=text)
+
+    def _close_progress_window(self):
+        """
+        CloseProgressWindow
+        進捗表示ウィンドウを閉じる
+        """
+        if self._progress_window is not None:
+            self._progress_window.destroy()
+            self._progress_window = None
+            self._progress_label = None
+            self._progress_bar = None
 
     def update_table_list(self):
         """
@@ -738,9 +1191,34 @@ class LineDBViewer(tk.Tk):
         テーブル一覧の更新
         """
         self.table_listbox.delete(0, tk.END)
-        for table in self.tables:
-            row_count = self.table_rows.get(table, 0)
-            self.table_listbox.insert(tk.END, f"{table} ({row_count:,} rows)")
+        self._table_names = list(self.tables)
+        if self._table_names:
+            self.table_listbox.insert(tk.END, *[self._format_table_entry(table) for table in self._table_names])
+
+    def _format_table_entry(self, table: str) -> str:
+        """
+        FormatTableEntry
+        テーブル一覧の表示文字列（推定行数には「~」を付ける）
+        """
+        row_count = self.table_rows.get(table, 0)
+        prefix = "" if table in self.exact_row_tables else "~"
+        return f"{table} ({prefix}{row_count:,} rows)"
+
+    def _update_table_row_count(self, table: str, row_count: int):
+        """
+        UpdateTableRowCount
+        正確な行数でテーブル一覧の表示を更新
+        """
+        self.table_rows[table] = row_count
+        self.exact_row_tables.add(table)
+        if table not in self._table_names:
+            return
+        index = self._table_names.index(table)
+        selection = self.table_listbox.curselection()
+        self.table_listbox.delete(index)
+        self.table_listbox.insert(index, self._format_table_entry(table))
+        for selected in selection:
+            self.table_listbox.selection_set(selected)
 
     def get_selected_table(self, clear_display: bool = True) -> Optional[str]:
         """
@@ -753,8 +1231,7 @@ class LineDBViewer(tk.Tk):
                 messagebox.showwarning("Warning/警告", "Selectable/テーブルを選択してください")
             return None
         
-        table_text = self.table_listbox.get(selection[0])
-        table_name = table_text.split(" (")[0]  # 行数の部分を除去
+        table_name = self._table_names[selection[0]]
         
         if clear_display:
             self.info_text.delete('1.0', tk.END)
@@ -770,11 +1247,42 @@ class LineDBViewer(tk.Tk):
         if not table_name:
             return
 
+        self._submit(
+            self._query_table_analysis, table_name,
+            on_done=lambda result: self._show_table_analysis(table_name, *result),
+            on_error=lambda e: messagebox.showerror("Error", f"テーブル分析エラー: {e}")
+        )
+
+    def _query_table_analysis(self, table_name: str) -> Tuple[List[tuple], int, Dict[str, Any]]:
+        """
+        QueryTableAnalysis (worker thread)
+        テーブル分析に必要な情報を取得（ワーカースレッドで実行）
+
+        行全体（BLOBを含む）は読み込まず、サンプル値はタイムスタンプのカラムのみ取得する。
+
+        Returns:
+            Tuple[List[tuple], int, Dict[str, Any]]: (カラム情報, 行数, カラム名ごとのサンプル値)
+        """
+        # SQLに埋め込むテーブル名は、DBから取得したテーブル一覧のものに限定
+        if table_name not in self.tables:
+            raise ValueError(f"Unknown table: {table_name}")
+
+        # テーブル情報を取得（仮想テーブルの非表示カラムは除外）
+        columns = [col for col in get_table_xinfo(self.cursor, table_name) if col[6] != 1]
+        row_count = self._count_table_rows(table_name)
+
+        # タイムスタンプのカラムのみサンプルデータを取得
+        timestamp_columns = [col[1] for col in columns if self.is_timestamp_column(col[1])]
+        samples = get_column_samples(self.cursor, table_name, timestamp_columns)
+        return columns, row_count, samples
+
+    def _show_table_analysis(self, table_name: str, columns: List[tuple],
+                             row_count: int, samples: Dict[str, Any]):
+        """
+        ShowTableAnalysis
+        テーブル分析結果を表示
+        """
         try:
-            # テーブル情報を取得
-            columns = get_table_info(self.cursor, table_name)
-            row_count = get_table_row_count(self.cursor, table_name)
-            
             # 分析結果を表示
             result_lines = [
                 f"=== {table_name} テーブル内訳表示 ===",
@@ -782,17 +1290,13 @@ class LineDBViewer(tk.Tk):
                 "\nカラム情報:",
                 "-" * 40
             ]
-            
-            # カラムごとのサンプルデータを取得
-            self.cursor.execute(f"SELECT * FROM {table_name} LIMIT 1")
-            sample_data = self.cursor.fetchone()
-            
-            for i, col in enumerate(columns):
-                col_id, name, type_name, notnull, default_val, pk = col
-                sample_value = sample_data[i] if sample_data else None
+
+            for col in columns:
+                col_id, name, type_name, notnull, default_val, pk, hidden = col
+                sample_value = samples.get(name)
                 
                 # タイムスタンプの場合は変換
-                if sample_value and self.is_timestamp_column(name):
+                if sample_value and name in samples:
                     try:
                         sample_value = convert_timestamp(sample_value, "JST")
                     except:
@@ -802,8 +1306,11 @@ class LineDBViewer(tk.Tk):
                     f"- {name} ({type_name})",
                     f"  {'[主キー] ' if pk else ''}"
                     f"{'[NOT NULL] ' if notnull else ''}"
+                    f"{'[生成カラム] ' if hidden else ''}"
                 ]
                 
+                if default_val is not None:
+                    col_info.append(f"  既定値: {default_val}")
                 if sample_value is not None:
                     col_info.append(f"  サンプル値: {sample_value}")
                 
@@ -823,10 +1330,19 @@ class LineDBViewer(tk.Tk):
         if not table_name:
             return
 
+        # Get deleted messages (worker thread)
+        self._submit(
+            lambda: check_deleted_messages(self.cursor, table_name),
+            on_done=self._show_deleted_messages,
+            on_error=lambda e: messagebox.showerror("Error", f"Error checking deleted messages: {e}")
+        )
+
+    def _show_deleted_messages(self, deleted_messages: List[tuple]):
+        """
+        ShowDeletedMessages
+        欠損データの確認結果を表示
+        """
         try:
-            # Get deleted messages
-            deleted_messages = check_deleted_messages(self.cursor, table_name)
-            
             if deleted_messages:
                 result_lines = [
                     "=== Deleted Messages ===",
@@ -859,18 +1375,35 @@ class LineDBViewer(tk.Tk):
         if not table_name:
             return
 
-        try:
-            # Execute export
-            excel_file = export_to_excel(self.cursor, table_name)
-            
+        # Show progress（出力はワーカースレッドで行う）
+        self._open_progress_window("Exporting", "Exporting to Excel...")
+
+        def on_progress(row_count: int):
+            if self._progress_label is not None:
+                self._progress_label.config(text=f"Exporting to Excel... {row_count:,} rows")
+
+        def on_exported(excel_file: Optional[str]):
+            self._close_progress_window()
             if excel_file:
                 messagebox.showinfo("Success", f"Data exported to Excel file:\n{excel_file}")
             else:
                 messagebox.showerror("Error", "Export failed")
-            
-        except Exception as e:
+
+        def on_error(e: Exception):
+            self._close_progress_window()
             messagebox.showerror("Error", f"Error exporting to Excel: {e}")
 
+        # Execute export (worker thread)
+        self._submit(
+            lambda: export_to_excel(
+                self.cursor,
+                table_name,
+                progress_callback=lambda row_count: self._post_to_ui(on_progress, row_count)
+            ),
+            on_done=on_exported,
+            on_error=on_error
+        )
+
     def update_result_text(self, text: str):
         """
         UpdateResultText
@@ -896,19 +1429,14 @@ class LineDBViewer(tk.Tk):
             # 前回の選択をクリア
             self._clear_selection_highlights()
             
-            # 行全体を選択
-            self.tree.item(item, tags=['selected_row'])
+            # 行全体とセルをハイライト（背景色のタグは外し、WALレコードの文字色のみ維持）
+            self.tree.item(item, tags=self._selected_row_tags(self.tree.item(item, 'tags')))
+            self._last_sel_item = item
             
             # クリックされたセルの情報を取得
             col_num = int(column.replace('#', '')) - 1  # '#1'から1を取得し、0ベースのインデックスに変換
             col_name = self.tree["columns"][col_num]    # カラム名を取得
-            value = self.tree.set(item, col_name)       # 値を取得
-            
-            # セルをハイライト
-            current_tags = list(self.tree.item(item).get('tags', []))
-            if 'selected_cell' not in current_tags:
-                current_tags.append('selected_cell')
-            self.tree.item(item, tags=current_tags)
+            value = self._get_display_row(int(item))[col_num]  # 値を取得（BLOBはbytesのまま）
             
             # 詳細表示を更新
             self._update_detail_view(col_name, value, item)
@@ -916,15 +1444,24 @@ class LineDBViewer(tk.Tk):
     def _clear_selection_highlights(self):
         """
         ClearSelectHighlights
-        選択のハイライトをクリア
+        選択のハイライトをクリア（前回選択した行のみ）
         """
-        for item in self.tree.get_children():
-            current_tags = list(self.tree.item(item).get('tags', []))
-            if 'selected_row' in current_tags:
-                current_tags.remove('selected_row')
-            if 'selected_cell' in current_tags:
-                current_tags.remove('selected_cell')
-            self.tree.item(item, tags=current_tags)
+        item = self._last_sel_item
+        self._last_sel_item = None
+        if item and self.tree.exists(item):
+            # 行番号から背景色・WALレコード・検索結果のタグを復元
+            self.tree.item(item, tags=self._row_tags(int(item)))
+
+    @staticmethod
+    def _selected_row_tags(tags: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        SelectedRowTags
+        選択した行のタグを取得
+
+        背景色を持つタグ（行の背景色・検索結果）が残っていると、タグの優先順位によっては
+        選択のハイライトが表示されないため、選択のタグと文字色のタグ（WALレコード）のみにする。
+        """
+        return ('selected_row', 'selected_cell') + (('wal_record',) if 'wal_record' in tags else ())
 
     def _update_detail_view(self, column_name: str, value: Any, item_id: str):
         """
@@ -934,19 +1471,48 @@ class LineDBViewer(tk.Tk):
         try:
             # データタイプの判定
             data_type = self._detect_data_type(column_name, value)
-            
-            # 基本情報の更新
-            self._update_basic_detail(column_name, value, item_id)
-            
-            # 拡張情報の更新
-            self._update_extended_detail(column_name, value, data_type)
-            
-            # HEX表示の更新
-            self._update_hex_detail(value, data_type)
-            
-            # 画像プレビューの更新
-            self._update_image_preview(value)
-            
+        except Exception as e:
+            self._show_error_in_details(f"Error/詳細表示エラー: {e}")
+            return
+
+        # 表示切替ボタン用に現在の値を保存
+        self.current_hex_data = (value, data_type)
+        self.current_image_data = value
+
+        # 全てのタブを未更新にし、表示中のタブのみ更新
+        self._pending_detail = (column_name, value, item_id, data_type)
+        self._dirty_detail_tabs = {str(frame) for frame in (
+            self.basic_detail_frame, self.extended_detail_frame,
+            self.hex_detail_frame, self.image_detail_frame
+        )}
+        self._refresh_active_detail_tab()
+
+    def _refresh_active_detail_tab(self):
+        """
+        RefreshActiveDetailTab
+        表示中の詳細タブが未更新の場合のみ、選択中の値で更新
+        """
+        tab = self.detail_notebook.select()
+        if self._pending_detail is None or tab not in self._dirty_detail_tabs:
+            return
+        self._dirty_detail_tabs.discard(tab)
+        column_name, value, item_id, data_type = self._pending_detail
+
+        try:
+            if tab == str(self.basic_detail_frame):
+                # 基本情報の更新
+                self._update_basic_detail(column_name, value, item_id)
+            elif tab == str(self.extended_detail_frame):
+                # 拡張情報の更新（タイムスタンプは表示用の文字列ではなく元の値を使用）
+                if data_type == "timestamp":
+                    value = self._original_value(item_id, column_name)
+                self._update_extended_detail(column_name, value, data_type)
+            elif tab == str(self.hex_detail_frame):
+                # HEX表示の更新
+                self._update_hex_detail(value, data_type)
+            elif tab == str(self.image_detail_frame):
+                # 画像プレビューの更新
+                self._update_image_preview(value)
         except Exception as e:
             self._show_error_in_details(f"Error/詳細表示エラー: {e}")
 
@@ -955,253 +1521,258 @@ class LineDBViewer(tk.Tk):
         ExtractDatetype
         データタイプを検出
         """
-        if self.is_timestamp_column(column_name):
+        if column_name in self._ts_cols:
             return "timestamp"
-        elif isinstance(value, str) and value.startswith("bplist"):
-            return "bplist"
-        elif isinstance(value, (bytes, bytearray)):
-            return "binary"
-        elif isinstance(value, str) and (value.startswith("{") or value.startswith("[")):
-            return "json"
-        else:
+        if isinstance(value, str):
+            # 文字列は先頭の文字だけで判定
+            if value.startswith("bplist"):
+                return "bplist"
+            if value.startswith(("{", "[")):
+                return "json"
             return "text"
+        if isinstance(value, (bytes, bytearray)):
+            return "binary"
+        if value is None:
+            return "null"
+        if isinstance(value, (int, float)):
+            return "number"
+        return "text"
+
+    @staticmethod
+    def _bulk_insert(widget, segments: List[Tuple[str, Any]]):
+        """
+        BulkInsert
+        (テキスト, タグ) のリストを1回の insert でまとめて挿入（Tclの呼び出しを1回にする）
+        """
+        if segments:
+            widget.insert(tk.END, *chain.from_iterable(segments))
 
     def _update_basic_detail(self, column_name: str, value: Any, item_id: str):
         """
         UpdateBasicDetail
         基本情報タブの更新
         """
-        self.detail_text.config(state=tk.NORMAL)
-        self.detail_text.delete('1.0', tk.END)
-        
-        # ヘッダー情報
-        self.detail_text.insert(tk.END, "=== BasicInfo基本情報 ===\n\n", 'header')
-        
-        # カラム情報
-        self.detail_text.insert(tk.END, f"カラム名: {column_name}\n", 'field')
-        self.detail_text.insert(tk.END, "-" * 40 + "\n\n")
+        # ヘッダー情報・カラム情報
+        segments = [
+            ("=== BasicInfo基本情報 ===\n\n", 'header'),
+            (f"カラム名: {column_name}\n", 'field'),
+            ("-" * 40 + "\n\n", ()),
+        ]
         
         # 値の表示（基本情報）
         if value is not None:
-            if self.is_timestamp_column(column_name):
-                try:
-                    # キャッシュから元の値を取得
-                    original_values = self.original_values_cache.get(item_id, {})
-                    if original_values:
-                        col_index = self.tree["columns"].index(column_name)
-                        original_value = original_values.get(col_index)
-                        
-                        if original_value is not None:
-                            self.detail_text.insert(tk.END, "オリジナル値:\n", 'field')
-                            self.detail_text.insert(tk.END, f"{original_value}\n\n", 'value')
-                    
-                    self.detail_text.insert(tk.END, "時刻 (JST):\n", 'field')
-                    self.detail_text.insert(tk.END, f"{value}\n", 'value')
-                except Exception as e:
-                    print(f"Error in timestamp display: {e}")
-                    self.detail_text.insert(tk.END, "値:\n", 'field')
-                    self.detail_text.insert(tk.END, f"{value}\n", 'value')
+            if column_name in self._ts_cols:
+                # 行ソースから変換前の値を取得
+                original_value = self._original_value(item_id, column_name)
+                if original_value is not None:
+                    segments.append(("オリジナル値:\n", 'field'))
+                    segments.append((f"{original_value}\n\n", 'value'))
+                
+                segments.append(("時刻 (JST):\n", 'field'))
+                segments.append((f"{value}\n", 'value'))
             else:
-                self.detail_text.insert(tk.END, "値:\n", 'field')
-                self.detail_text.insert(tk.END, f"{str(value)[:1000]}\n", 'value')
-                if len(str(value)) > 1000:
-                    self.detail_text.insert(tk.END, "...(省略)...\n", 'info')
+                # 先頭のみ表示（値全体の文字列化は1回だけ、バイナリはreprを作らず16進数で表示）
+                PREVIEW_CHARS = 1000
+                if isinstance(value, (bytes, bytearray)):
+                    preview = value[:PREVIEW_CHARS // 2].hex()
+                    truncated = len(value) > PREVIEW_CHARS // 2
+                else:
+                    text = value if isinstance(value, str) else str(value)
+                    preview = text[:PREVIEW_CHARS]
+                    truncated = len(text) > PREVIEW_CHARS
+                segments.append(("値:\n", 'field'))
+                segments.append((f"{preview}\n", 'value'))
+                if truncated:
+                    segments.append(("...(省略)...\n", 'info'))
         else:
-            self.detail_text.insert(tk.END, "値: NULL\n", 'null')
+            segments.append(("値: NULL\n", 'null'))
         
-        # 行の位置情報
-        try:
-            row_position = len(self.tree.get_children()[:self.tree.index(item_id)]) + 1
-            self.detail_text.insert(tk.END, "\n--- レコード情報 ---\n", 'header')
-            self.detail_text.insert(tk.END, f"レコード番号: {row_position}\n", 'info')
-        except Exception:
-            pass  # 行位置の取得に失敗した場合は無視
+        # 行の位置情報（iidは行ソース上の行番号のため、Tkへの問い合わせは不要）
+        if item_id.isdigit():
+            segments.append(("\n--- レコード情報 ---\n", 'header'))
+            segments.append((f"レコード番号: {int(item_id) + 1}\n", 'info'))
         
-        self._apply_text_styles(self.detail_text)
+        self.detail_text.config(state=tk.NORMAL)
+        self.detail_text.delete('1.0', tk.END)
+        self._bulk_insert(self.detail_text, segments)
         self.detail_text.config(state=tk.DISABLED)
 
     def _update_extended_detail(self, column_name: str, value: Any, data_type: str):
         """
         UpdateExtendeDetail
         拡張情報タブの更新"""
+        segments = self._extended_detail_segments(value, data_type)
+        
         self.extended_detail_text.config(state=tk.NORMAL)
         self.extended_detail_text.delete('1.0', tk.END)
-        
-        self.extended_detail_text.insert(tk.END, f"=== ExtendedInfo/拡張情報 ({data_type}) ===\n\n", 'header')
+        self._bulk_insert(self.extended_detail_text, segments)
+        self.extended_detail_text.config(state=tk.DISABLED)
+
+    def _extended_detail_segments(self, value: Any, data_type: str) -> List[Tuple[str, Any]]:
+        """
+        ExtendedDetailSegments
+        拡張情報タブの表示内容を (テキスト, タグ) のリストで作成
+        """
+        segments = [(f"=== ExtendedInfo/拡張情報 ({data_type}) ===\n\n", 'header')]
         
         try:
             if data_type == "bplist":
-                self._show_bplist_details(value)
+                segments += self._show_bplist_details(value)
             elif data_type == "binary":
-                self._show_binary_details(value)
+                segments += self._show_binary_details(value)
             elif data_type == "json":
-                self._show_json_details(value)
+                segments += self._show_json_details(value)
             elif data_type == "timestamp":
-                self._show_timestamp_details(value)
+                segments += self._show_timestamp_details(value)
+            elif data_type == "null":
+                segments.append(("値: NULL\n", 'null'))
+            elif data_type == "number":
+                segments += self._show_number_details(value)
             else:
-                self._show_text_details(value)
+                segments += self._show_text_details(value if isinstance(value, str) else str(value))
         except Exception as e:
-            self.extended_detail_text.insert(tk.END, f"拡張情報の解析に失敗しました: {e}\n", 'error')
-        
-        self._apply_text_styles(self.extended_detail_text)
-        self.extended_detail_text.config(state=tk.DISABLED)
+            segments.append((f"拡張情報の解析に失敗しました: {e}\n", 'error'))
+        return segments
 
-    def _show_bplist_details(self, value: str):
+    def _show_number_details(self, value: Any) -> List[Tuple[str, Any]]:
         """
-        BpilistDetails
-        bplistデータの詳細表示
+        NumberDetails
+        数値（INTEGER / REAL）の詳細表示（表示内容を (テキスト, タグ) のリストで返す）
         """
-        self.extended_detail_text.insert(tk.END, "bplistデータ解析:\n", 'field')
-        try:
-            # bplistデータの解析処理をここに実装
-            # 必要に応じて外部ライブラリを使用
-            self.extended_detail_text.insert(tk.END, "データ形式: バイナリPlist\n", 'info')
-            self.extended_detail_text.insert(tk.END, "サイズ: " + str(len(value)) + " bytes\n", 'info')
-            # 解析結果の表示
-        except Exception as e:
-            self.extended_detail_text.insert(tk.END, f"bplistの解析に失敗: {e}\n", 'error')
+        segments = [
+            ("数値解析:\n", 'field'),
+            (f"型: {'REAL' if isinstance(value, float) else 'INTEGER'}\n", 'info'),
+            (f"値: {value}\n", 'info'),
+        ]
+        if not isinstance(value, float):
+            segments.append((f"16進数: {value:#x}\n", 'info'))
+        return segments
 
-    def _show_binary_details(self, value: bytes):
+    def _show_bplist_details(self, value: str) -> List[Tuple[str, Any]]:
+        """
+        BpilistDetails
+        bplistデータの詳細表示（表示内容を (テキスト, タグ) のリストで返す）
+        """
+        # bplistデータの解析処理をここに実装
+        # 必要に応じて外部ライブラリを使用
+        return [
+            ("bplistデータ解析:\n", 'field'),
+            ("データ形式: バイナリPlist\n", 'info'),
+            (f"サイズ: {len(value)} bytes\n", 'info'),
+        ]
+
+    def _show_binary_details(self, value: bytes) -> List[Tuple[str, Any]]:
         """
         GUI_Binarydetails
-        バイナリデータの詳細表示
+        バイナリデータの詳細表示（表示内容を (テキスト, タグ) のリストで返す）
         """
-        self.extended_detail_text.insert(tk.END, "バイナリデータ解析:\n", 'field')
-        self.extended_detail_text.insert(tk.END, f"サイズ: {len(value)} bytes\n\n", 'info')
+        segments = [
+            ("バイナリデータ解析:\n", 'field'),
+            (f"サイズ: {len(value)} bytes\n\n", 'info'),
+        ]
 
-        # 16進数ダンプとASCII表示を生成
-        BYTES_PER_LINE = 16
-        offset = 0
-        
-        while offset < len(value):
-            # オフセットを表示
-            self.extended_detail_text.insert(tk.END, f"{offset:08x}  ", 'offset')
-            
-            chunk = value[offset:offset + BYTES_PER_LINE]
-            hex_values = []
-            ascii_values = []
-            
-            # 16進数とASCII文字を生成
-            for i, byte in enumerate(chunk):
-                hex_values.append(f"{byte:02x}")
-                # 表示可能なASCII文字の場合はその文字を、それ以外は'.'を表示
-                ascii_values.append(chr(byte) if 32 <= byte <= 126 else '.')
-                
-                # 8バイトごとに空白を追加
-                if i == 7:
-                    hex_values.append('')
-            
-            # 16進数部分の表示（不足分はスペースで埋める）
-            hex_line = ' '.join(hex_values)
-            hex_line = hex_line.ljust(49)  # 16*2 + 15 + 1 (spaces) + 1 (middle space)
-            self.extended_detail_text.insert(tk.END, hex_line + " │ ", 'hex')
-            
-            # ASCII部分の表示
-            ascii_line = ''.join(ascii_values)
-            self.extended_detail_text.insert(tk.END, ascii_line, 'ascii')
-            self.extended_detail_text.insert(tk.END, "\n")
-            
-            offset += BYTES_PER_LINE
-            
-            # 表示行数を制限（最初の256バイトまで）
-            if offset >= 256:
-                self.extended_detail_text.insert(tk.END, "\n... (残りは省略) ...\n", 'info')
-                self.extended_detail_text.insert(tk.END, "[全て表示]", 'link')
-                break
+        # 16進数ダンプとASCII表示を生成（最初の256バイトまで）
+        PREVIEW_BYTES = 256
+        for offset, hex_line, ascii_line in hex_dump_lines(bytes(value[:PREVIEW_BYTES])):
+            segments.extend((
+                (f"{offset:08x}  ", 'offset'),
+                (hex_line.lower().ljust(49) + " │ ", 'hex'),
+                (ascii_line, 'ascii'),
+                ("\n", ()),
+            ))
+
+        if len(value) > PREVIEW_BYTES:
+            segments.append(("\n... (残りは省略) ...\n", 'info'))
+            segments.append(("[全て表示]", 'link'))
+        return segments
 
-    def _show_json_details(self, value: str):
+    def _show_json_details(self, value: str) -> List[Tuple[str, Any]]:
         """
         JSONDetails
-        JSONデータの詳細表示
+        JSONデータの詳細表示（表示内容を (テキスト, タグ) のリストで返す）
         """
         try:
             json_data = json.loads(value)
-            formatted_json = json.dumps(json_data, indent=2, ensure_ascii=False)
-            self.extended_detail_text.insert(tk.END, "JSON構造:\n", 'field')
-            self.extended_detail_text.insert(tk.END, formatted_json + "\n", 'value')
         except json.JSONDecodeError as e:
-            self.extended_detail_text.insert(tk.END, f"JSONの解析に失敗: {e}\n", 'error')
+            return [(f"JSONの解析に失敗: {e}\n", 'error')]
+        formatted_json = json.dumps(json_data, indent=2, ensure_ascii=False)
+        return [
+            ("JSON構造:\n", 'field'),
+            (formatted_json + "\n", 'value'),
+        ]
 
-    def _show_timestamp_details(self, value: str):
+    def _show_timestamp_details(self, value: Optional[str]) -> List[Tuple[str, Any]]:
         """
         Timestampdetails
-        タイムスタンプの詳細表示
+        タイムスタンプの詳細表示（値の解析は1回だけ行い、各形式で使い回す）
+        表示内容を (テキスト, タグ) のリストで返す
         """
-        try:
-            # 様々な形式での時刻表示
-            formats = {
-                "JST (日本時間)": "Asia/Tokyo",
-                "UTC (世界協定時)": "UTC",
-                "GMT (グリニッジ標準時)": "GMT",
-                "US/Pacific (太平洋時間)": "US/Pacific",
-                "US/Eastern (東部時間)": "US/Eastern",
-                "Europe/London (英国時間)": "Europe/London",
-                "Europe/Paris (中央ヨーロッパ時間)": "Europe/Paris",
-                "Asia/Shanghai (中国時間)": "Asia/Shanghai",
-                "Asia/Seoul (韓国時間)": "Asia/Seoul",
-                "Australia/Sydney (シドニー時間)": "Australia/Sydney"
-            }
-            
-            # UNIX時間での表示
-            self.extended_detail_text.insert(tk.END, "=== UNIX時間表示 ===\n", 'header')
-            try:
-                unix_formats = {
-                    "UNIX秒": "UNIX_second",
-                    "UNIXミリ秒": "UNIX_millisecond",
-                    "UNIXマイクロ秒": "UNIX_microsecond"
-                }
-                for label, fmt in unix_formats.items():
-                    unix_time = convert_timestamp(value, fmt)
-                    self.extended_detail_text.insert(tk.END, f"{label}:\n", 'field')
-                    self.extended_detail_text.insert(tk.END, f"{unix_time}\n", 'value')
-            except:
-                pass
+        parsed = parse_timestamp(value) if value not in (None, "") else None
+        if parsed is None:
+            return [("タイムスタンプとして解釈できない値です\n", 'info')]
 
+        sections = (
+            # UNIX時間での表示
+            ("=== UNIX時間表示 ===\n", (
+                ("UNIX秒", "UNIX_second"),
+                ("UNIXミリ秒", "UNIX_millisecond"),
+                ("UNIXマイクロ秒", "UNIX_microsecond"),
+            )),
             # プラットフォーム固有の表示
-            self.extended_detail_text.insert(tk.END, "\n=== プラットフォーム固有表示 ===\n", 'header')
-            try:
-                platform_formats = {
-                    "Windows (FILETIME)": "FILETIME",
-                    "Mac (HFS+)": "MAC",
-                    "COCOA": "COCOA",
-                    "WebKit": "WEBKIT",
-                    "Chrome": "CHROME",
-                    "Firefox": "FIREFOX"
-                }
-                for label, fmt in platform_formats.items():
-                    platform_time = convert_timestamp(value, fmt)
-                    self.extended_detail_text.insert(tk.END, f"{label}:\n", 'field')
-                    self.extended_detail_text.insert(tk.END, f"{platform_time}\n", 'value')
-            except:
-                pass
-
+            ("\n=== プラットフォーム固有表示 ===\n", (
+                ("Windows (FILETIME)", "FILETIME"),
+                ("Mac (HFS+)", "MAC"),
+                ("COCOA", "COCOA"),
+                ("WebKit", "WEBKIT"),
+                ("Chrome", "CHROME"),
+                ("Firefox", "FIREFOX"),
+            )),
             # タイムゾーン別の表示
-            self.extended_detail_text.insert(tk.END, "\n=== タイムゾーン別表示 ===\n", 'header')
-            for tz_name, tz in formats.items():
-                try:
-                    converted_time = convert_timestamp(value, tz)
-                    self.extended_detail_text.insert(tk.END, f"{tz_name}:\n", 'field')
-                    self.extended_detail_text.insert(tk.END, f"{converted_time}\n", 'value')
-                except:
-                    continue
-                    
-        except Exception as e:
-            self.extended_detail_text.insert(tk.END, f"タイムスタンプの変換に失敗: {e}\n", 'error')
+            ("\n=== タイムゾーン別表示 ===\n", (
+                ("JST (日本時間)", "Asia/Tokyo"),
+                ("UTC (世界協定時)", "UTC"),
+                ("GMT (グリニッジ標準時)", "GMT"),
+                ("US/Pacific (太平洋時間)", "US/Pacific"),
+                ("US/Eastern (東部時間)", "US/Eastern"),
+                ("Europe/London (英国時間)", "Europe/London"),
+                ("Europe/Paris (中央ヨーロッパ時間)", "Europe/Paris"),
+                ("Asia/Shanghai (中国時間)", "Asia/Shanghai"),
+                ("Asia/Seoul (韓国時間)", "Asia/Seoul"),
+                ("Australia/Sydney (シドニー時間)", "Australia/Sydney"),
+            )),
+        )
 
-    def _show_text_details(self, value: str):
+        segments = []
+        for header, formats in sections:
+            segments.append((header, 'header'))
+            for label, fmt in formats:
+                segments.append((f"{label}:\n", 'field'))
+                segments.append((f"{format_timestamp(parsed, fmt)}\n", 'value'))
+        return segments
+
+    def _show_text_details(self, value: str) -> List[Tuple[str, Any]]:
         """
         TextFileDetails
-        テキストデータの詳細表示
-        """
-        self.extended_detail_text.insert(tk.END, "テキスト解析:\n", 'field')
-        self.extended_detail_text.insert(tk.END, f"文字数: {len(value)}\n", 'info')
-        self.extended_detail_text.insert(tk.END, f"行数: {value.count('\n') + 1}\n", 'info')
-        if len(value) > 0:
-            self.extended_detail_text.insert(tk.END, "\n文字種別:\n", 'field')
-            if value.isascii():
-                self.extended_detail_text.insert(tk.END, "ASCII文字のみ\n", 'info')
+        テキストデータの詳細表示（表示内容を (テキスト, タグ) のリストで返す）
+        """
+        # 大きな値は先頭だけを調べる（クリックのたびに全体を走査しない）
+        length = len(value)
+        probe = value[:self.TEXT_PROBE_SIZE] if length > self.TEXT_PROBE_SIZE else value
+        suffix = "" if probe is value else f" (概算: 先頭{self.TEXT_PROBE_SIZE}文字から)"
+        line_count = probe.count('\n') + 1
+
+        segments = [
+            ("テキスト解析:\n", 'field'),
+            (f"文字数: {length}\n", 'info'),
+            (f"行数: {line_count}{suffix}\n", 'info'),
+        ]
+        if length > 0:
+            segments.append((f"\n文字種別{suffix}:\n", 'field'))
+            if probe.isascii():
+                segments.append(("ASCII文字のみ\n", 'info'))
             else:
-                self.extended_detail_text.insert(tk.END, "非ASCII文字を含む\n", 'info')
+                segments.append(("非ASCII文字を含む\n", 'info'))
+        return segments
 
     def _apply_text_styles(self, text_widget):
         """
@@ -1258,6 +1829,11 @@ class LineDBViewer(tk.Tk):
                                 font=('Courier', 10),
                                 foreground='#999999')
 
+        # リンク表示用スタイル
+        text_widget.tag_configure('link', 
+                                foreground='#0066cc',
+                                underline=True)
+
     def _show_error_in_details(self, error_message: str):
         """
         ShowErrorInDetails
@@ -1274,7 +1850,7 @@ class LineDBViewer(tk.Tk):
         selection = self.tree.selection()
         if selection:
             item = selection[0]
-            values = self.tree.item(item)['values']
+            values = self._get_display_row(int(item))
             if values:
                 text = "\n".join(str(v) for v in values)
                 self.update_result_text(text)
@@ -1286,11 +1862,11 @@ class LineDBViewer(tk.Tk):
         region = self.tree.identify('region', event.x, event.y)
         if region == "heading":
             column = self.tree.identify_column(event.x)
-            column_name = self.tree["columns"][int(column[1]) - 1]
+            column_name = self.tree["columns"][int(column[1:]) - 1]
             
-            if self.is_timestamp_column(column_name):
-                menu = TimeFormatMenu(self, column_name, self._on_time_format_change)
-                menu.post(event.x_root, event.y_root)
+            menu = self._tf_menus.get(column_name)
+            if menu is not None:
+                menu.tk_popup(event.x_root, event.y_root)
 
     def _on_time_format_change(self, column_name: str, format_type: str):
         """時間フォーマットの変更処理"""
@@ -1299,136 +1875,361 @@ class LineDBViewer(tk.Tk):
 
     def _refresh_tree_data(self):
         """ツリービューのデータを更新"""
-        for item in self.tree.get_children():
-            values = list(self.tree.item(item)['values'])
-            for i, col in enumerate(self.tree["columns"]):
-                if self.is_timestamp_column(col):
-                    values[i] = convert_timestamp(
-                        values[i],
-                        self.time_display_modes.get(col, "JST")
-                    )
-            self.tree.item(item, values=values)
+        # 変換済みチャンクを破棄し、表示中のウィンドウを元データから再変換
+        first = self.tree.yview()[0]
+        self._window_cache.clear()
+        self._render_window(self._window_start, reset=True)
+        self.tree.yview_moveto(first)
+
+        # 表示形式が変わったため検索インデックスも再作成
+        self._rebuild_search_index()
+
+    def _original_value(self, item_id: str, column_name: str) -> Any:
+        """
+        OriginalValue
+        表示用に変換する前の値を取得（iidは行ソース上の行番号のため、別途保存しない）
+        """
+        return self.current_data[int(item_id)][self.current_columns.index(column_name)]
+
+    @staticmethod
+    def _convert_rows(source: List[tuple], timestamp_modes: List[Tuple[int, str]]) -> List[list]:
+        """
+        ConvertRows
+        複数行を表示用に変換（タイムスタンプのカラムのみ、カラム単位でまとめて変換）
+
+        Args:
+            source (List[tuple]): 変換する行
+            timestamp_modes (List[Tuple[int, str]]): タイムスタンプのカラム番号と表示形式
+        """
+        rows = [list(row) for row in source]
+        for j, mode in timestamp_modes:
+            for row, value in zip(rows, convert_timestamps([row[j] for row in rows], mode)):
+                row[j] = value
+        return rows
+
+    def _get_chunk(self, chunk_start: int) -> List[list]:
+        """
+        GetChunk
+        表示用に変換済みの行データをチャンク単位で取得（LRUキャッシュ）
+        """
+        rows = self._window_cache.get(chunk_start)
+        if rows is not None:
+            self._window_cache.move_to_end(chunk_start)
+            return rows
+
+        source = self.current_data[chunk_start:chunk_start + self.CHUNK_SIZE]
+        columns = self.current_columns
+        timestamp_modes = [(j, self.time_display_modes.get(columns[j], "JST")) for j in self._ts_col_indices]
+        rows = self._convert_rows(source, timestamp_modes)
+        self._window_cache[chunk_start] = rows
+        if len(self._window_cache) > self.WINDOW_CACHE_SIZE:
+            self._window_cache.popitem(last=False)
+        return rows
+
+    def _get_display_row(self, index: int) -> list:
+        """
+        GetDisplayRow
+        表示用に変換済みの1行を取得（Tkに問い合わせず、チャンクのキャッシュから取得）
+        """
+        chunk_start = index - index % self.CHUNK_SIZE
+        return self._get_chunk(chunk_start)[index - chunk_start]
+
+    def _row_tags(self, index: int) -> Tuple[str, ...]:
+        """
+        RowTags
+        行番号に応じたタグを取得（背景色・WALレコード・検索結果）
+        """
+        key = index & 1
+        if index in self.wal_records:
+            key |= 2
+        if index in self._search_matches:
+            key |= 4
+        return self.ROW_TAG_SETS[key]
+
+    def _insert_rows(self, start: int, end: int, position: Any = tk.END):
+        """
+        InsertRows
+        指定範囲の行をツリービューに挿入（iidは行番号）
+
+        Treeviewの再描画はアイドル時にまとめて1回行われるため、ループ中に
+        update_idletasks() などで描画を挟まないこと。変換済みの行はチャンク単位で
+        取得し、1行ごとのキャッシュ参照を避ける。
+        """
+        insert = self.tree.insert
+        row_tags = self._row_tags
+        index = start
+        while index < end:
+            chunk_start = index - index % self.CHUNK_SIZE
+            chunk = self._get_chunk(chunk_start)
+            chunk_end = min(end, chunk_start + self.CHUNK_SIZE)
+            for i in range(index, chunk_end):
+                insert("", position if position == tk.END else position + i - start,
+                       iid=str(i), values=chunk[i - chunk_start], tags=row_tags(i))
+            index = chunk_end
+
+    def _render_window(self, start: int, reset: bool = False):
+        """
+        RenderWindow
+        ツリービューに展開する行範囲（ウィンドウ）を更新
+
+        前回のウィンドウと重なる行はそのまま残し、差分の行のみ削除・挿入する。
+        """
+        total = len(self.current_data)
+        start = max(0, min(start, total - self.WINDOW_SIZE))
+        end = min(start + self.WINDOW_SIZE, total)
+        old_start, old_end = self._window_start, self._window_end
+
+        if not reset and (start, end) == (old_start, old_end):
+            return
+
+        if not reset and old_start < start < old_end:
+            # 下方向へスライド
+            self.tree.delete(*(str(i) for i in range(old_start, start)))
+            self._insert_rows(old_end, end)
+        elif not reset and start < old_start < end:
+            # 上方向へスライド
+            self.tree.delete(*(str(i) for i in range(end, old_end)))
+            self._insert_rows(start, old_start, 0)
+        else:
+            # 全体を再構築
+            children = self.tree.get_children()
+            if children:
+                self.tree.delete(*children)
+            self._insert_rows(start, end)
+
+        self._window_start, self._window_end = start, end
+
+    def _scroll_to_row(self, row: int):
+        """
+        ScrollToRow
+        指定行が先頭付近に表示されるようにウィンドウを移動
+        """
+        total = len(self.current_data)
+        if total == 0:
+            return
+        row = max(0, min(row, total - 1))
+
+        # 表示中の行数を考慮して、指定行がウィンドウ中央付近に来るように配置
+        first, last = self.tree.yview()
+        visible = max(1, int((last - first) * max(1, self._window_end - self._window_start)))
+        self._render_window(row - (self.WINDOW_SIZE - visible) // 2)
+
+        window_len = self._window_end - self._window_start
+        self.tree.yview_moveto((row - self._window_start) / window_len)
+
+    def _on_tree_yscroll(self, first: str, last: str):
+        """
+        TreeYScroll
+        ツリービューのスクロール位置を全体の位置に変換してスクロールバーに反映し、
+        ウィンドウの端に近づいたら次の範囲を展開
+        """
+        total = len(self.current_data)
+        window_len = self._window_end - self._window_start
+        if total == 0 or window_len == 0:
+            self.tree_y_scrollbar.set(first, last)
+            return
+
+        first, last = float(first), float(last)
+        top = self._window_start + first * window_len
+        bottom = self._window_start + last * window_len
+        self.tree_y_scrollbar.set(top / total, bottom / total)
+
+        near_end = last >= 0.9 and self._window_end < total
+        near_start = first <= 0.1 and self._window_start > 0
+        if (near_end or near_start) and not self._window_shift_pending:
+            # スクロールコールバック中の再構築を避けるため、アイドル時に移動
+            self._window_shift_pending = True
+            self.after_idle(self._shift_window, int(top))
+
+    def _shift_window(self, top: int):
+        """
+        ShiftWindow
+        ウィンドウを移動（表示位置は維持）
+        """
+        self._window_shift_pending = False
+        self._scroll_to_row(top)
+
+    def _on_tree_yview(self, *args):
+        """
+        TreeYView
+        スクロールバー操作をテーブル全体に対する位置として処理
+        """
+        total = len(self.current_data)
+        window_len = self._window_end - self._window_start
+        if args[0] != 'moveto' or total == 0 or window_len == 0:
+            # 行・ページ単位のスクロールはウィンドウ内で行い、端での移動は_on_tree_yscrollで処理
+            self.tree.yview(*args)
+            return
+
+        row = int(float(args[1]) * total)
+        first, last = self.tree.yview()
+        visible = int((last - first) * window_len)
+        if self._window_start <= row and row + visible <= self._window_end:
+            self.tree.yview_moveto((row - self._window_start) / window_len)
+        else:
+            self._scroll_to_row(row)
+
+    def _configure_styles(self):
+        """
+        ConfigureStyles
+        ツリービューのスタイルを設定（ウィジェット作成前に1回だけ実行）
+        """
+        style = ttk.Style()
+        style.configure("Treeview",
+                       rowheight=25,            # 行の高さ
+                       borderwidth=1,           # ボーダー幅
+                       relief="solid",          # ボーダーのスタイル
+                       font=('TkDefaultFont', 10),  # フォント設定
+                       background="white",      # 背景色
+                       fieldbackground="white", # フィールドの背景色
+                       foreground="black")      # テキストの色
+
+        # ヘッダーのスタイル設定
+        style.configure("Treeview.Heading",
+                       borderwidth=1,           # ヘッダーのボーダー幅
+                       relief="solid",          # ヘッダーのボーダースタイル
+                       font=('TkDefaultFont', 10, 'bold'),  # ヘッダーのフォント
+                       background="SystemButtonFace",  # ヘッダーの背景色
+                       foreground="black")      # ヘッダーのテキスト色
 
     def _configure_tree_tags(self):
         """ツリービューのタグを設定"""
+        # ttk::treeview では先に作成したタグほど優先されるため、強調表示のタグを先に設定する
         self.tree.tag_configure('search_result', background='#fff3cd')  # 検索結果
         self.tree.tag_configure('selected_row', background='#cce5ff')   # 選択行
         self.tree.tag_configure('selected_cell', background='#e2e3e5')  # 選択セル
         self.tree.tag_configure('wal_record', foreground='red')         # WALレコード
+        # 行の背景色（全ての行に付くため、強調表示を隠さないよう最後に設定）
+        self.tree.tag_configure('evenrow', background='#f0f0f0')
+        self.tree.tag_configure('oddrow', background='white')
 
     def is_timestamp_column(self, column_name: str) -> bool:
         """
         SearchTimestampColumn
-        タイムスタンプカラムかどうかを判定
-        """
-        timestamp_keywords = [
-            # 一般的なタイムスタンプキーワード
-            'TIMESTAMP',
-            'TIME',
-            'DATE',
-            # 作成・更新関連
-            'CREATED',
-            'MODIFIED',
-            'UPDATED',
-            'LAST_UPDATED',
-            'LAST_MODIFIED',
-            'CREATE_TIME',
-            'UPDATE_TIME',
-            'MOD_TIME',
-            # LINE特有のプレフィックス
-            'Z_TIMESTAMP',
-            'ZLASTUPDATE',
-            'ZLASTMODIFIED',
-            'ZCREATEDAT',
-            'ZUPDATEDAT',
-            # その他の一般的な表現
-            'DATETIME',
-            'POSTED_AT',
-            'SENT_AT',
-            'RECEIVED_AT',
-            'DELIVERED_AT',
-            'READ_AT',
-            'ACCESSED_AT',
-            'LOGGED_AT',
-            # 日付関連
-            'BIRTH',
-            'DEATH',
-            'START',
-            'END',
-            'EXPIRE',
-            'DEADLINE'
-        ]
-        return any(keyword in column_name.upper() for keyword in timestamp_keywords)
+        タイムスタンプカラムかどうかを判定（結果はカラム名ごとにキャッシュ）
+        """
+        try:
+            return self._ts_col_cache[column_name]
+        except KeyError:
+            result = self.TIMESTAMP_PATTERN.search(column_name) is not None
+            self._ts_col_cache[column_name] = result
+            return result
+
+    def _schedule_search(self):
+        """
+        ScheduleSearch
+        入力中の検索を遅延実行（入力が150ms止まった時点で1回だけ検索）
+        """
+        if self._search_after:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+
+        search_text = self.search_var.get()
+        if not search_text:
+            self._clear_search()
+            return
+        if len(search_text) < 2:
+            return  # 1文字ではほぼ全行に一致するため検索しない
+
+        self._search_after = self.after(150, self._perform_search)
 
     def _perform_search(self):
         """検索を実行"""
+        # 遅延中の検索を取り消し、世代番号を進める（実行中の古い検索結果は破棄される）
+        if self._search_after:
+            self.after_cancel(self._search_after)
+        self._search_after = None
+        self._search_gen += 1
+        generation = self._search_gen
+
         search_text = self.search_var.get()
         if not search_text:
             self._clear_search()
             return
 
+        # 検索対象のカラムを決定
+        search_column = self.search_column_var.get()
+        if search_column == "すべて":
+            index_column = None
+            columns_to_search = range(len(self.current_columns))
+        else:
+            try:
+                index_column = self.current_columns.index(search_column)
+                columns_to_search = [index_column]
+            except ValueError:
+                index_column = None
+                columns_to_search = []
+
+        # 全文検索インデックスが利用できる場合は、ワーカースレッドで候補行を絞り込む
+        index = self._search_index
+        if index is not None and columns_to_search and len(search_text) >= SEARCH_INDEX_MIN_LENGTH:
+            data = self.current_data
+
+            def on_candidates(candidates: Optional[set]):
+                if generation == self._search_gen and data is self.current_data:
+                    self._apply_search(search_text, columns_to_search, candidates)
+
+            self._submit(search_index, index, search_text, index_column, on_done=on_candidates)
+        else:
+            self._apply_search(search_text, columns_to_search, None)
+
+    def _apply_search(self, search_text: str, columns_to_search, candidates: Optional[set]):
+        """
+        ApplySearch
+        検索条件で行を判定し、結果をハイライト
+
+        Args:
+            search_text (str): 検索文字列
+            columns_to_search: 検索対象のカラム番号
+            candidates (Optional[set]): 全文検索インデックスで絞り込んだ候補行（Noneの場合は全行）
+        """
         # 以前の検索結果をクリア
         self._clear_search_highlights()
 
         # 検索条件を取得
         case_sensitive = self.case_sensitive_var.get()
         include_null = self.include_null_var.get()
-        search_column = self.search_column_var.get()
         search_condition = self.search_condition_var.get()
 
+        # NULL値はツリービューの表示と同じく"None"として比較
+        null_text = "None"
         if not case_sensitive:
             search_text = search_text.lower()
+            null_text = null_text.lower()
+
+        # 検索条件に応じた比較関数（ループの外で1回だけ選択）
+        matcher = self.SEARCH_MATCHERS.get(search_condition, str.__contains__)
+
+        # 検索実行（ツリービューに展開済みの行だけでなく、行ソース全体を対象にする）
+        strings = self._get_search_strings(lower=not case_sensitive)
+        if candidates is None:
+            rows_to_search = range(len(strings))
+        else:
+            rows_to_search = sorted(candidates)
 
-        # 検索実行
         matches = []
-        for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            
-            # 検索対象のカラムを決定
-            if search_column == "すべて":
-                columns_to_search = range(len(values))
-            else:
-                try:
-                    col_idx = self.tree["columns"].index(search_column)
-                    columns_to_search = [col_idx]
-                except ValueError:
-                    continue
+        for index in rows_to_search:
+            values = strings[index]
 
             # 各カラムで検索
             for col_idx in columns_to_search:
                 value = values[col_idx]
-                
-                # NULL値の処理
                 if value is None:
-                    if include_null:
-                        matches.append(item)
-                    continue
+                    if not include_null:
+                        continue
+                    value = null_text
 
-                str_value = str(value)
-                if not case_sensitive:
-                    str_value = str_value.lower()
-
-                # 検索条件に応じた比較
-                match = False
-                if search_condition == "完全一致":
-                    match = str_value == search_text
-                elif search_condition == "前方一致":
-                    match = str_value.startswith(search_text)
-                elif search_condition == "後方一致":
-                    match = str_value.endswith(search_text)
-                else:  # 含む
-                    match = search_text in str_value
-
-                if match:
-                    matches.append(item)
+                if matcher(value, search_text):
+                    matches.append(index)
                     break
 
-        # 検索結果をハイライト
-        for item in matches:
-            current_tags = list(self.tree.item(item).get('tags', []))
-            if 'search_result' not in current_tags:
-                current_tags.append('search_result')
-            self.tree.item(item, tags=current_tags)
+        # 検索結果をハイライト（展開済みの行に反映し、以降はウィンドウ展開時に付与）
+        self._search_matches = set(matches)
+        for item in self.tree.get_children():
+            if int(item) in self._search_matches:
+                current_tags = self.tree.item(item, 'tags')
+                if 'search_result' not in current_tags:
+                    self.tree.item(item, tags=(*current_tags, 'search_result'))
         
         # 検索結果数を更新
         match_count = len(matches)
@@ -1437,27 +2238,102 @@ class LineDBViewer(tk.Tk):
                 text=f"検索結果: {match_count}件"
             )
             # 最初の検索結果にスクロール
-            self.tree.see(matches[0])
+            self._scroll_to_row(matches[0])
+            self.tree.see(str(matches[0]))
         else:
             self.search_count_label.config(text="検索結果: 0件")
 
+    def _get_search_strings(self, lower: bool) -> List[Tuple[Optional[str], ...]]:
+        """
+        GetSearchStrings
+        表示と同じ形式の値を文字列化した行を取得（検索のたびに変換しないようキャッシュ）
+
+        Args:
+            lower (bool): 小文字化した文字列を取得するかどうか（大文字小文字を区別しない検索用）
+        """
+        rows = self._search_strings.get(lower)
+        if rows is None:
+            if lower:
+                rows = [tuple(None if v is None else v.lower() for v in row)
+                        for row in self._get_search_strings(lower=False)]
+            else:
+                rows = [tuple(None if v is None else str(v) for v in row)
+                        for row in self._iter_search_rows(self.current_data, self.current_columns,
+                                                          dict(self.time_display_modes))]
+            self._search_strings[lower] = rows
+        return rows
+
     def _clear_search(self):
         """検索をクリア"""
+        # 遅延中・実行中の検索を無効化
+        if self._search_after:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+        self._search_gen += 1
+
         self.search_var.set("")
         self._clear_search_highlights()
         self.search_count_label.config(text="")
 
     def _clear_search_highlights(self):
-        """検索結果のハイライトをクリア"""
-        for item in self.tree.get_children():
-            current_tags = list(self.tree.item(item).get('tags', []))
-            if 'search_result' in current_tags:
-                current_tags.remove('search_result')
-            self.tree.item(item, tags=current_tags)
+        """検索結果のハイライトをクリア（タグが付いている行のみ処理）"""
+        self._search_matches = set()
+        for item in self.tree.tag_has('search_result'):
+            tags = [tag for tag in self.tree.item(item, 'tags') if tag != 'search_result']
+            self.tree.item(item, tags=tags)
+
+    def _rebuild_search_index(self):
+        """
+        RebuildSearchIndex
+        表示中テーブルの全文検索インデックスをワーカースレッドで再作成
+
+        インデックスには表示用の値（タイムスタンプは表示形式に変換後の値）を登録する。
+        作成が完了するまでは、通常の検索（全行の走査）を行う。
+        """
+        self._search_index_gen += 1
+        generation = self._search_index_gen
+        old_index, self._search_index = self._search_index, None
+
+        # 表示用の値が変わるため、検索用の文字列もあわせて破棄
+        self._search_strings = {}
+
+        data = self.current_data
+        columns = self.current_columns
+        display_modes = dict(self.time_display_modes)
+
+        def build() -> Optional[sqlite3.Connection]:
+            if old_index is not None:
+                old_index.close()
+            rows = self._iter_search_rows(data, columns, display_modes)
+            return build_search_index(rows, len(columns))
+
+        def on_built(index: Optional[sqlite3.Connection]):
+            if generation == self._search_index_gen:
+                self._search_index = index
+            elif index is not None:
+                # 作成中に別のテーブルが選択された場合は破棄
+                self._submit(index.close)
+
+        self._submit(build, on_done=on_built)
+
+    def _iter_search_rows(self, data: List[tuple], columns: List[str],
+                          display_modes: Dict[str, str]):
+        """
+        IterSearchRows (worker thread)
+        検索インデックス用に、表示と同じ形式に変換した行を順に返す
+        """
+        timestamp_modes = [(j, display_modes.get(col, "JST"))
+                           for j, col in enumerate(columns) if self.is_timestamp_column(col)]
+        for start in range(0, len(data), self.CHUNK_SIZE):
+            yield from self._convert_rows(data[start:start + self.CHUNK_SIZE], timestamp_modes)
 
     def _calculate_column_widths(self, columns: List[str], data: List[tuple]) -> Dict[str, int]:
         """カラム幅を計算
 
+        テーブル全体から等間隔に抽出した最大200行をもとに、各カラムの値の長さの
+        95パーセンタイルを幅とする（一部の極端に長い値に引きずられないため）。
+        フォントでの幅の計測は、カラムごとに代表値1つのみ行う。
+
         Args:
             columns (List[str]): カラム名のリスト
             data (List[tuple]): テーブルデータ
@@ -1468,48 +2344,48 @@ class LineDBViewer(tk.Tk):
         # 定数定義
         MIN_WIDTH = 50      # 最小幅（ピクセル）
         MAX_WIDTH = 300     # 最大幅（ピクセル）
-        CHAR_WIDTH = 7      # 文字あたりの平均幅（ピクセル）
+        PADDING = 16        # セルの余白（ピクセル）
         TIMESTAMP_WIDTH = 180  # タイムスタンプ用の固定幅
-        
-        # カラム幅の初期化（カラム名の長さを基準）
-        col_widths = {col: len(str(col)) for col in columns}
-        
+        SAMPLE_SIZE = 200   # 幅の計算に使用する行数
+        MAX_CHARS = 100     # 計測する最大文字数（これ以上は最大幅）
+        DEFAULT_WIDTH = 150  # 時間内に計算できなかったカラムの幅
+        TIME_BUDGET = 0.02  # 計算に使う時間の上限（秒、カラム数が多いテーブル用）
+
         try:
-            # サンプリングするデータ数を制限（パフォーマンス向上のため）
-            sample_size = min(1000, len(data))
-            sample_data = data[:sample_size]
-            
-            # データからカラム幅を計算
-            for row in sample_data:
-                for i, value in enumerate(row):
-                    col = columns[i]
-                    if value is not None:
-                        str_value = str(value)
-                        
-                        # カラムタイプに応じた処理
-                        if self.is_timestamp_column(col):
-                            # タイムスタンプは固定幅を使用
-                            col_widths[col] = TIMESTAMP_WIDTH
-                        elif len(str_value) > 100:
-                            # 長いテキストは最大幅を使用
-                            col_widths[col] = MAX_WIDTH
-                        else:
-                            # 通常のデータは内容に応じて調整
-                            col_widths[col] = max(
-                                col_widths[col],
-                                min(len(str_value), MAX_WIDTH // CHAR_WIDTH)
-                            )
-            
-            # ピクセル単位に変換して返却
-            return {
-                col: min(max(width * CHAR_WIDTH, MIN_WIDTH), MAX_WIDTH)
-                for col, width in col_widths.items()
-            }
-            
+            font = tkfont.Font(font=('TkDefaultFont', 10))
+
+            # 等間隔にサンプリング（先頭に偏らないように）
+            step = max(1, len(data) // SAMPLE_SIZE)
+            sample_data = data[::step][:SAMPLE_SIZE]
+
+            col_widths = {}
+            deadline = time.perf_counter() + TIME_BUDGET
+            for i, col in enumerate(columns):
+                if col in self._ts_cols:
+                    # タイムスタンプは固定幅を使用
+                    col_widths[col] = TIMESTAMP_WIDTH
+                    continue
+                if time.perf_counter() > deadline:
+                    # 時間の上限を超えた残りのカラムは既定の幅
+                    col_widths[col] = DEFAULT_WIDTH
+                    continue
+
+                # 値の長さの95パーセンタイルに当たる値を代表値とする（文字列はstr()を省略）
+                values = [v if isinstance(v, str) else str(v)
+                          for v in map(itemgetter(i), sample_data) if v is not None]
+                values.sort(key=len)
+                representative = values[int((len(values) - 1) * 0.95)][:MAX_CHARS] if values else ""
+
+                # カラム名と代表値の長い方をフォントで計測
+                width = max(font.measure(str(col)), font.measure(representative)) + PADDING
+                col_widths[col] = min(max(width, MIN_WIDTH), MAX_WIDTH)
+
+            return col_widths
+
         except Exception as e:
             print(f"カラム幅の計算エラー: {e}")
             # エラー時はデフォルト値を返却
-            return {col: 150 for col in columns}
+            return {col: DEFAULT_WIDTH for col in columns}
 
     def on_table_select(self, event):
         """テーブル選択時の処理"""
@@ -1517,33 +2393,22 @@ class LineDBViewer(tk.Tk):
         if not table_name:
             return
 
-        try:
-            # オリジナル値キャッシュをクリア
-            self.original_values_cache.clear()
-            
-            # プログレスバーを表示
-            progress_window = tk.Toplevel(self)
-            progress_window.title("Loading Table Data...")
-            progress_window.geometry("400x80")
-            progress_window.transient(self)
-            progress_window.grab_set()
-            
-            progress_label = ttk.Label(progress_window, text="テーブルデータを読み込み中...")
-            progress_label.pack(pady=(10,5))
-            progress_bar = ttk.Progressbar(progress_window, mode='indeterminate')
-            progress_bar.pack(fill=tk.X, padx=20, pady=5)
-            progress_bar.start(10)
-            progress_window.update()
+        # 閾値を設定（例：10000行）
+        THRESHOLD = 10000
+
+        # プログレスバーを表示
+        self._open_progress_window("Loading Table Data...", "テーブルデータを読み込み中...")
+
+        def on_error(e: Exception):
+            self._close_progress_window()
+            messagebox.showerror("エラー", f"テーブル内容の読み込みエラー: {e}")
+
+        def on_row_count(total_rows: int):
+            self._update_table_row_count(table_name, total_rows)
 
-            # テーブルの行数を取得
-            total_rows = get_table_row_count(self.cursor, table_name)
-            
-            # 閾値を設定（例：10000行）
-            THRESHOLD = 10000
-            
             # 大きなテーブルの場合は警告を表示
             if total_rows > THRESHOLD:
-                progress_window.destroy()
+                self._close_progress_window()
                 response = messagebox.askquestion(
                     "表示行数の選択",
                     f"このテーブルには{total_rows:,}行のデータがあります。\n"
@@ -1553,137 +2418,139 @@ class LineDBViewer(tk.Tk):
                     icon='question'
                 )
                 limit = None if response == 'yes' else THRESHOLD
-                
+
                 # プログレスバーを再表示
-                progress_window = tk.Toplevel(self)
-                progress_window.title("Loading Table Data...")
-                progress_window.geometry("400x80")
-                progress_window.transient(self)
-                progress_window.grab_set()
-                
-                progress_label = ttk.Label(progress_window, text="テーブルデータを読み込み中...")
-                progress_label.pack(pady=(10,5))
-                progress_bar = ttk.Progressbar(progress_window, mode='indeterminate')
-                progress_bar.pack(fill=tk.X, padx=20, pady=5)
-                progress_bar.start(10)
-                progress_window.update()
+                self._open_progress_window("Loading Table Data...", "テーブルデータを読み込み中...")
             else:
                 limit = None  # 小さなテーブルは全て表示
 
             # テーブルの内容をWALデータと共に取得
-            columns, data, wal_records = get_table_contents_with_wal(
-                self.cursor, 
-                table_name, 
-                self.current_db_path,
-                limit=limit
+            self._submit(
+                lambda: get_table_contents_with_wal(
+                    self.cursor,
+                    table_name,
+                    self._opened_db_path,
+                    limit=limit
+                ),
+                on_done=lambda contents: on_contents(contents, total_rows, limit),
+                on_error=on_error
             )
-            self.wal_records = wal_records  # WALレコードを保存
-            
-            if not columns or not data:
-                progress_window.destroy()
-                return
 
-            # ツリービューをクリア
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+        def on_contents(contents: Tuple[List[str], List[tuple], set], total_rows: int,
+                        limit: Optional[int]):
+            try:
+                self._show_table_contents(*contents, total_rows, limit)
+            except Exception as e:
+                on_error(e)
+
+        # テーブルの正確な行数を取得（キャッシュ済みの場合は再計算しない）
+        self._submit(
+            self._count_table_rows, table_name,
+            on_done=on_row_count,
+            on_error=on_error
+        )
 
-            # カラムを設定
-            self.tree["columns"] = columns
-            self.tree["show"] = "headings"
+    def _show_table_contents(self, columns: List[str], data: List[tuple], wal_records: set,
+                             total_rows: int, limit: Optional[int]):
+        """
+        ShowTableContents
+        取得したテーブル内容をツリービューに表示
+        """
+        # 前のテーブルの値は詳細タブに反映しない
+        self._pending_detail = None
+        self._dirty_detail_tabs.clear()
 
-            # 検索用のカラムコンボボックスを更新
-            self.column_combo['values'] = ["すべて"] + list(columns)
-            self.column_combo.set("すべて")
+        # WALレコードの行番号を保存（行ごとに参照するためsetにする）
+        self.wal_records = wal_records if isinstance(wal_records, (set, frozenset)) else set(wal_records)
 
-            # カラム幅を計算
-            col_widths = self._calculate_column_widths(columns, data)
+        if not columns or not data:
+            self._close_progress_window()
+            return
 
-            # カラムの設定
-            for col in columns:
-                self.tree.heading(col, 
-                                text=col,
-                                anchor=tk.CENTER)
-                
-                self.tree.column(col,
-                               width=col_widths[col],
-                               minwidth=80,
-                               stretch=True,
-                               anchor=tk.W)
-                
-                if self.is_timestamp_column(col):
-                    self.tree.heading(col, text=f"{col} 🕒")
-                    self.tree.heading(col, command=lambda c=col: self._show_time_format_menu(c))
+        # ツリービューをクリア
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+        # 行ソースと仮想スクロールの状態を初期化
+        self.current_columns = list(columns)
+        self.current_data = data
+        self._ts_cols = frozenset(col for col in columns if self.is_timestamp_column(col))
+        self._ts_col_indices = tuple(j for j, col in enumerate(columns) if col in self._ts_cols)
+
+        # 表示形式メニューを作り直す（前のテーブルのメニューは破棄）
+        for menu in self._tf_menus.values():
+            menu.destroy()
+        self._tf_menus = {
+            col: TimeFormatMenu(self, col, self._on_time_format_change) for col in self._ts_cols
+        }
+        self._window_cache.clear()
+        self._window_start = self._window_end = 0
+        self._search_matches = set()
+
+        # カラムを設定
+        self.tree["columns"] = columns
+        self.tree["show"] = "headings"
+
+        # 検索用のカラムコンボボックスを更新
+        self.column_combo['values'] = ["すべて"] + list(columns)
+        self.column_combo.set("すべて")
+
+        # カラム幅を計算
+        col_widths = self._calculate_column_widths(columns, data)
+
+        # カラムの設定
+        for col in columns:
+            self.tree.heading(col, 
+                            text=col,
+                            anchor=tk.CENTER)
+            
+            self.tree.column(col,
+                           width=col_widths[col],
+                           minwidth=80,
+                           stretch=True,
+                           anchor=tk.W)
+            
+            if col in self._ts_cols:
+                self.tree.heading(col, text=f"{col} 🕒")
+                self.tree.heading(col, command=lambda c=col: self._show_time_format_menu(c))
 
-            # グリッド線の表示設定を更新
-            self.tree.tag_configure('evenrow', background='#f0f0f0')
-            self.tree.tag_configure('oddrow', background='white')
+        # 先頭のウィンドウ分の行のみを展開（残りはスクロールに応じて展開）
+        self._render_window(0, reset=True)
+        self.tree.yview_moveto(0)
 
-            # データを効率的に追加
-            progress_label.config(text="データを表示中...")
-            progress_window.update()
-            
-            batch_size = 100  # バッチサイズを設定
-            for batch_start in range(0, len(data), batch_size):
-                batch_end = min(batch_start + batch_size, len(data))
-                batch_data = data[batch_start:batch_end]
-                
-                for i, row in enumerate(batch_data):
-                    actual_index = batch_start + i
-                    converted_row = list(row)
-                    timestamp_columns = {}
-                    
-                    # タイムスタンプカラムを効率的に処理
-                    for j, col in enumerate(columns):
-                        if self.is_timestamp_column(col) and converted_row[j] is not None:
-                            try:
-                                # 元の値を保存
-                                timestamp_columns[j] = str(converted_row[j])
-                                # 値を変換
-                                converted_row[j] = convert_timestamp(converted_row[j], "JST")
-                            except Exception:
-                                pass  # 変換に失敗した場合は元の値のまま
-                    
-                    # 行の背景色を設定
-                    row_tags = ['evenrow' if actual_index % 2 == 0 else 'oddrow']
-                    
-                    # WALレコードのチェック
-                    if actual_index in self.wal_records:
-                        row_tags.append('wal_record')
-                    
-                    # 行を挿入
-                    item = self.tree.insert("", tk.END, values=converted_row, tags=row_tags)
-                    
-                    # オリジナル値をキャッシュに保存
-                    if timestamp_columns:
-                        self.original_values_cache[item] = timestamp_columns
-                
-                # UIを更新（レスポンシブにするため）
-                if batch_start % (batch_size * 5) == 0:  # 5バッチごとに更新
-                    progress_window.update()
+        # 検索用の全文検索インデックスをバックグラウンドで作成
+        self._rebuild_search_index()
 
-            progress_window.destroy()
+        self._close_progress_window()
 
-            # ステータス表示を更新
-            status_text = f"表示中: {len(data):,} 行 (WALデータ: {len(self.wal_records):,} 行)"
-            if limit and total_rows > limit:
-                status_text += f" / 全{total_rows:,}行"
-            self.update_status(status_text)
+        # ステータス表示を更新
+        status_text = f"表示中: {len(data):,} 行 (WALデータ: {len(self.wal_records):,} 行)"
+        if limit and total_rows > limit:
+            status_text += f" / 全{total_rows:,}行"
+        self.update_status(status_text)
 
-            # テーブル情報を表示
-            self.analyze_table()
+        # テーブル情報はツリーの描画後に表示（テーブルを続けて切り替えた場合は最後の1回のみ）
+        if self._analysis_after:
+            self.after_cancel(self._analysis_after)
+        self._analysis_after = self.after_idle(self._run_deferred_analysis)
 
-        except Exception as e:
-            if 'progress_window' in locals():
-                progress_window.destroy()
-            messagebox.showerror("エラー", f"テーブル内容の読み込みエラー: {e}")
+    def _run_deferred_analysis(self):
+        """
+        RunDeferredAnalysis
+        予約したテーブル分析を実行
+        """
+        self._analysis_after = None
+        self.analyze_table()
 
     def _show_time_format_menu(self, column_name: str):
         """
         ShoeTimestampMenu
         タイムスタンプの表示形式メニューを表示
         """
-        menu = TimeFormatMenu(self, column_name, self._on_time_format_change)
-        menu.post(self.winfo_pointerx(), self.winfo_pointery())
+        menu = self._tf_menus.get(column_name)
+        if menu is not None:
+            menu.tk_popup(self.winfo_pointerx(), self.winfo_pointery())
 
     def update_status(self, text: str):
         """
@@ -1695,23 +2562,40 @@ class LineDBViewer(tk.Tk):
             self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
         self.status_label.config(text=text)
 
-    def __del__(self):
+    def _toggle_hex_display(self):
+        """
+        ToggleHexDisplay
+        HEXの表示範囲（先頭のみ/全て）を切り替え
+        """
+        self.show_full_hex_var.set(not self.show_full_hex_var.get())
+        if hasattr(self, 'current_hex_data'):
+            self._update_hex_detail(*self.current_hex_data)
+            self._dirty_detail_tabs.discard(str(self.hex_detail_frame))
+
+        # ボタンのテキストを更新
+        if self.show_full_hex_var.get():
+            self.toggle_hex_button.config(text="Abbreviation/省略表示")
+        else:
+            self.toggle_hex_button.config(text="ShowAll/全て表示")
+
+    def _show_full_hex(self):
         """
-        Destructor:Closeddatebaseconnection
-        デストラクタ：データベース接続を閉じる
+        ShowFullHex
+        HEX表示タブに切り替え、データ全体を表示
         """
-        if self.conn:
-            self.cursor.close()
-            self.conn.close()
+        if not self.show_full_hex_var.get():
+            self._toggle_hex_display()
+        self.detail_notebook.select(self.hex_detail_frame)
 
     def _update_hex_detail(self, value: Any, data_type: str):
         """
         UpdateHEXDetails
-        HEX表示タブの更新
+        HEX表示タブの更新（表示内容を (テキスト, タグ) のリストにまとめ、1回で挿入）
         """
-        self.hex_detail_text.config(state=tk.NORMAL)
-        self.hex_detail_text.delete('1.0', tk.END)
+        # 現在のデータを保存
+        self.current_hex_data = (value, data_type)
 
+        segments = []
         try:
             # データをバイト列に変換
             if isinstance(value, (bytes, bytearray)):
@@ -1723,74 +2607,98 @@ class LineDBViewer(tk.Tk):
             else:
                 byte_data = str(value).encode('utf-8')
 
-            # サイズ情報を表示
-            self.hex_detail_text.insert(tk.END, f"データサイズ: {len(byte_data)} bytes\n\n", 'info')
-
-            # ヘッダー行を追加
-            self.hex_detail_text.insert(tk.END, "Address     ", 'header')
-            self.hex_detail_text.insert(tk.END, "│ ", 'separator')
-            
-            # 16進数のヘッダーを作成
-            hex_header = ""
-            for i in range(16):
-                if i == 8:
-                    hex_header += " "
-                hex_header += f"{i:02X}"
-                if i < 15:
-                    hex_header += " "
-            
-            self.hex_detail_text.insert(tk.END, hex_header, 'header')
-            self.hex_detail_text.insert(tk.END, " │ ", 'separator')
-            self.hex_detail_text.insert(tk.END, "ASCII\n", 'header')
-
-            # 区切り線
-            self.hex_detail_text.insert(tk.END, "─" * 10, 'separator')
-            self.hex_detail_text.insert(tk.END, "┼", 'separator')
-            self.hex_detail_text.insert(tk.END, "─" * 48, 'separator')
-            self.hex_detail_text.insert(tk.END, "┼", 'separator')
-            self.hex_detail_text.insert(tk.END, "─" * 16, 'separator')
-            self.hex_detail_text.insert(tk.END, "\n")
-
-            # 16進数ダンプとASCII表示を生成（全データを表示）
-            BYTES_PER_LINE = 16
-            offset = 0
-            
-            while offset < len(byte_data):
-                # オフセットを表示
-                self.hex_detail_text.insert(tk.END, f"{offset:08X}", 'offset')
-                self.hex_detail_text.insert(tk.END, " │ ", 'separator')
-                
-                chunk = byte_data[offset:offset + BYTES_PER_LINE]
-                hex_values = []
-                ascii_values = []
-                
-                # 16進数とASCII文字を生成
-                for i, byte in enumerate(chunk):
-                    hex_values.append(f"{byte:02X}")
-                    ascii_values.append(chr(byte) if 32 <= byte <= 126 else '.')
-                    
-                    if i == 7:
-                        hex_values.append('')
-                
-                # 16進数部分の表示（不足分はスペースで埋める）
-                hex_line = ' '.join(hex_values)
-                hex_line = hex_line.ljust(47)
-                self.hex_detail_text.insert(tk.END, hex_line, 'hex')
-                self.hex_detail_text.insert(tk.END, " │ ", 'separator')
-                
-                # ASCII部分の表示
-                ascii_line = ''.join(ascii_values).ljust(16)
-                self.hex_detail_text.insert(tk.END, ascii_line, 'ascii')
-                self.hex_detail_text.insert(tk.END, "\n")
-                
-                offset += BYTES_PER_LINE
+            # 16進数のヘッダー（00 01 ... 0F、8バイトごとに空白を追加）
+            hex_header = hex_dump_lines(bytes(range(16)))[0][1]
+
+            segments.extend((
+                # サイズ情報
+                (f"データサイズ: {len(byte_data)} bytes\n\n", 'info'),
+                # ヘッダー行
+                ("Address     ", 'header'),
+                ("│ ", 'separator'),
+                (hex_header, 'header'),
+                (" │ ", 'separator'),
+                ("ASCII\n", 'header'),
+                # 区切り線
+                ("─" * 10 + "┼" + "─" * 48 + "┼" + "─" * 16, 'separator'),
+                ("\n", ()),
+            ))
+
+            # 大きなデータは先頭のみ表示
+            total_size = len(byte_data)
+            if not self.show_full_hex_var.get() and total_size > self.HEX_DISPLAY_LIMIT:
+                byte_data = byte_data[:self.HEX_DISPLAY_LIMIT]
+
+            # 16進数ダンプとASCII表示（最初の HEX_RENDER_LINES 行のみ。続きはスクロールに合わせて描画）
+            self._hex_render_data = bytes(byte_data)
+            self._hex_render_offset = 0
+            self._hex_render_total = total_size
+            segments.extend(self._next_hex_segments())
 
         except Exception as e:
-            self.hex_detail_text.insert(tk.END, f"ShowHEXError/HEX表示エラー: {e}\n", 'error')
+            self._hex_render_data = b''
+            segments.append((f"ShowHEXError/HEX表示エラー: {e}\n", 'error'))
 
-        self._apply_text_styles(self.hex_detail_text)
+        self.hex_detail_text.config(state=tk.NORMAL)
+        self.hex_detail_text.delete('1.0', tk.END)
+        self._bulk_insert(self.hex_detail_text, segments)
         self.hex_detail_text.config(state=tk.DISABLED)
 
+    def _next_hex_segments(self) -> List[Tuple[str, Any]]:
+        """
+        NextHEXSegments
+        HEXダンプの未描画部分から HEX_RENDER_LINES 行分の (テキスト, タグ) のリストを作成
+
+        Returns:
+            List[Tuple[str, Any]]: 挿入する (テキスト, タグ) のリスト（描画済みの場合は空）
+        """
+        data = self._hex_render_data
+        start = self._hex_render_offset
+        if start >= len(data):
+            return []
+        end = min(len(data), start + self.HEX_RENDER_LINES * 16)
+        self._hex_render_offset = end
+
+        segments = []
+        for offset, hex_line, ascii_line in hex_dump_lines(data[start:end], start_offset=start):
+            segments.extend((
+                (f"{offset:08X}", 'offset'),
+                (" │ ", 'separator'),
+                (hex_line, 'hex'),
+                (" │ ", 'separator'),
+                (ascii_line.ljust(16), 'ascii'),
+                ("\n", ()),
+            ))
+
+        if end == len(data) and len(data) < self._hex_render_total:
+            segments.append((
+                f"\n... 先頭 {len(data):,} / {self._hex_render_total:,} bytes を表示中（「全て表示」で全体を表示）\n",
+                'info'
+            ))
+        return segments
+
+    def _on_hex_scroll(self, first: str, last: str):
+        """
+        OnHEXScroll
+        HEX表示のスクロール位置の変更（スクロールバーを更新し、末尾に近づいたら続きの描画を予約）
+        """
+        self.hex_detail_text.vbar.set(first, last)
+        if (float(last) > 0.8 and self._hex_render_after is None
+                and self._hex_render_offset < len(self._hex_render_data)):
+            self._hex_render_after = self.after_idle(self._render_more_hex)
+
+    def _render_more_hex(self):
+        """
+        RenderMoreHEX
+        HEXダンプの続きを HEX_RENDER_LINES 行分描画
+        """
+        self._hex_render_after = None
+        segments = self._next_hex_segments()
+        if segments:
+            self.hex_detail_text.config(state=tk.NORMAL)
+            self._bulk_insert(self.hex_detail_text, segments)
+            self.hex_detail_text.config(state=tk.DISABLED)
+
     def _detect_image_from_hex(self, data: bytes) -> Optional[Tuple[str, bytes]]:
         """
         ExtractImagefromHex
@@ -1799,27 +2707,16 @@ class LineDBViewer(tk.Tk):
         Returns:
             Optional[Tuple[str, bytes]]: (image_type, image_data) or None
         """
-        # 主要な画像形式のマジックナンバー
-        IMAGE_SIGNATURES = {
-            b'\xE0\xDD\xD8\xFF': 'JPEG',
-            b'\x61\x39\x38\x46\x49\x47': 'GIF(GIF89a)',
-            b'\x61\x37\x38\x46\x49\x47': 'GIF(GIF87a)',
-            b'\x0A\x1A\x0A\x0D\x47\x4E\x50\x89': 'PNG',
-            b'BM': 'BMP',
-            b'\x00\x00\x01\x00': 'ICO',
-            b'II*\x00': 'TIFF',
-            b'MM\x00*': 'TIFF',
-            b'\x53\x50\x42\x38': 'PSD',
-            b'\x46\x46\x49\x52': 'Webp'
-        }
-        
         # データがバイト列でない場合は変換（完全なデータを保持）
-        if not isinstance(data, bytes):
+        if isinstance(data, bytearray):
+            data = bytes(data)
+        elif not isinstance(data, bytes):
             try:
                 if isinstance(data, str):
-                    # 16進文字列の場合
-                    if all(c in '0123456789ABCDEFabcdef' for c in data.replace(' ', '')):
-                        data = bytes.fromhex(data.replace(' ', ''))
+                    # 16進文字列の場合（空白の除去と判定はどちらもC実装で行う）
+                    hex_text = data.translate(self.WHITESPACE_DELETE)
+                    if self.HEX_STRING_PATTERN.fullmatch(hex_text):
+                        data = bytes.fromhex(hex_text)
                     else:
                         data = data.encode('utf-8')
                 else:
@@ -1827,18 +2724,11 @@ class LineDBViewer(tk.Tk):
             except:
                 return None
         
-        # 画像シグネチャの検索（完全なデータを返す）
-        for signature, image_type in IMAGE_SIGNATURES.items():
-            if data.startswith(signature):
-                return image_type, data
-            
-            # データ内の任意の位置で画像を検索
-            pos = data.find(signature)
-            if pos >= 0:
-                # 見つかった位置から末尾までの完全なデータを返す
-                return image_type, data[pos:]
-        
-        return None
+        # 画像シグネチャの照合（先頭のみ。データ全体の検索は行わない）
+        image_type = detect_image_type(data)
+        if image_type is None:
+            return None
+        return image_type, data
 
     def _toggle_image_display(self):
         """
@@ -1855,6 +2745,56 @@ class LineDBViewer(tk.Tk):
         else:
             self.toggle_image_button.config(text="ShowAll/全て表示")
 
+    def _image_cache_key(self, image_data: bytes, max_size: Tuple[int, int]) -> Tuple[bytes, Tuple[int, int]]:
+        """
+        ImageCacheKey
+        縮小済み画像のキャッシュキー（画像データのハッシュ, 最大サイズ）を取得
+        """
+        last_data, digest = self._img_last_digest
+        if image_data is not last_data:
+            digest = hashlib.blake2b(image_data, digest_size=16).digest()
+            self._img_last_digest = (image_data, digest)
+        return digest, max_size
+
+    @staticmethod
+    def _decode_image(image_data: bytes, max_size: Tuple[int, int], high_quality: bool):
+        """
+        DecodeImage
+        画像データをデコードして縮小（画像用スレッドで実行）
+
+        Args:
+            image_data (bytes): 画像データ
+            max_size (Tuple[int, int]): 最大サイズ
+            high_quality (bool): LANCZOSで縮小するかどうか（省略表示ではより高速なBILINEARを使う）
+
+        Returns:
+            PIL.Image.Image: 縮小後の画像
+        """
+        Image, _ = _get_pil()
+        image = Image.open(io.BytesIO(image_data))
+        resample = Image.Resampling.LANCZOS if high_quality else Image.Resampling.BILINEAR
+        image.thumbnail(max_size, resample)
+        image.load()
+        return image
+
+    def _store_image_photo(self, key: Tuple[bytes, Tuple[int, int]], image
+                           ) -> Tuple["ImageTk.PhotoImage", Tuple[int, int], str]:
+        """
+        StoreImagePhoto
+        縮小済みの画像からPhotoImageを作成してLRUキャッシュに登録（メインスレッドで実行）
+
+        スタンプなど同じ画像を繰り返し表示する場合に、デコードと縮小を省略する。
+
+        Returns:
+            Tuple[ImageTk.PhotoImage, Tuple[int, int], str]: (PhotoImage, 縮小後のサイズ, モード)
+        """
+        _, ImageTk = _get_pil()
+        cached = (ImageTk.PhotoImage(image), image.size, image.mode)
+        self._img_cache[key] = cached
+        if len(self._img_cache) > self.IMAGE_CACHE_SIZE:
+            self._img_cache.popitem(last=False)
+        return cached
+
     def _update_image_preview(self, value: Any, force_update: bool = False):
         """
         UpdateImageView
@@ -1862,6 +2802,12 @@ class LineDBViewer(tk.Tk):
         """
         self.image_canvas.delete('all')
         self.image_info_label.config(text="")
+
+        # 実行中のデコードは不要になるので取り消す（開始済みの場合は結果を破棄する）
+        self._preview_gen += 1
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+            self._preview_future = None
         
         try:
             # 現在のデータを保存
@@ -1875,9 +2821,6 @@ class LineDBViewer(tk.Tk):
             
             image_type, image_data = image_info
             
-            # 画像の読み込みと表示
-            image = Image.open(io.BytesIO(image_data))
-            
             # キャンバスのサイズを取得
             canvas_width = self.image_canvas.winfo_width()
             canvas_height = self.image_canvas.winfo_height()
@@ -1890,38 +2833,93 @@ class LineDBViewer(tk.Tk):
                 # フルサイズ表示モード
                 # スクロール可能な大きさに制限
                 max_size = (800, 600)
-                image.thumbnail(max_size, Image.Resampling.LANCZOS)
             else:
                 # 省略表示モード
                 # キャンバスサイズに合わせる
-                image.thumbnail((canvas_width, canvas_height), Image.Resampling.LANCZOS)
-            
-            # PhotoImageに変換
-            photo = ImageTk.PhotoImage(image)
-            
-            # キャンバスのサイズを更新（必要な場合）
-            if self.show_full_image_var.get():
-                self.image_canvas.config(
-                    width=max(canvas_width, photo.width()),
-                    height=max(canvas_height, photo.height())
-                )
-            
-            # 画像をキャンバスの中央に配置
-            x = (self.image_canvas.winfo_width() - photo.width()) // 2
-            y = (self.image_canvas.winfo_height() - photo.height()) // 2
-            
-            # 画像の表示
-            self.image_canvas.create_image(x, y, image=photo, anchor=tk.NW)
-            self.image_canvas.image = photo  # 参照を保持
-            
-            # 画像情報の表示
-            info_text = f"ImageType/画像タイプ: {image_type}\n"
-            info_text += f"Size/サイズ: {image.size[0]}x{image.size[1]} px\n"
-            info_text += f"Mode/モード: {image.mode}"
-            self.image_info_label.config(text=info_text)
+                max_size = (canvas_width, canvas_height)
             
+            # 縮小済みのPhotoImageがあればそのまま表示（同じ画像はデコードしない）
+            key = self._image_cache_key(image_data, max_size)
+            cached = self._img_cache.get(key)
+            if cached is not None:
+                self._img_cache.move_to_end(key)
+                self._show_image_photo(cached, image_type)
+                return
+
+            # デコードと縮小は画像用スレッドで行い、完了後にメインスレッドで表示する
+            self.image_info_label.config(text="Loading/読み込み中...")
+            gen = self._preview_gen
+
+            def on_decoded(future: Future):
+                # 画像用スレッドから呼ばれるため、メインスレッドへ渡す
+                if not future.cancelled():
+                    self._post_to_ui(self._finish_image_preview, gen, key, image_type, future)
+
+            self._preview_future = self._preview_executor.submit(
+                self._decode_image, image_data, max_size, self.show_full_image_var.get()
+            )
+            self._preview_future.add_done_callback(on_decoded)
+
         except Exception as e:
-            self.image_info_label.config(text=f"ShowImageError/画像の表示に失敗しました: {e}")
+            self.image_info_label.config(text=f"ShowImageError/画像の表示に失敗しました:\n{e}")
+
+    def _finish_image_preview(self, gen: int, key: Tuple[bytes, Tuple[int, int]],
+                              image_type: str, future: Future):
+        """
+        FinishImagePreview
+        画像用スレッドでのデコード完了後に画像を表示（メインスレッドで実行）
+
+        Args:
+            gen (int): デコード開始時の世代番号（別の画像が選択された場合は破棄する）
+            key (Tuple[bytes, Tuple[int, int]]): キャッシュキー
+            image_type (str): 画像形式名
+            future (Future): デコード処理のFuture
+        """
+        if gen != self._preview_gen:
+            return
+        self._preview_future = None
+        try:
+            cached = self._store_image_photo(key, future.result())
+            self._show_image_photo(cached, image_type)
+        except Exception as e:
+            self.image_info_label.config(text=f"ShowImageError/画像の表示に失敗しました:\n{e}")
+
+    def _show_image_photo(self, cached: Tuple["ImageTk.PhotoImage", Tuple[int, int], str], image_type: str):
+        """
+        ShowImagePhoto
+        縮小済みのPhotoImageをキャンバスに表示
+
+        Args:
+            cached (Tuple[ImageTk.PhotoImage, Tuple[int, int], str]): (PhotoImage, 縮小後のサイズ, モード)
+            image_type (str): 画像形式名
+        """
+        photo, image_size, image_mode = cached
+        canvas_width = self.image_canvas.winfo_width()
+        canvas_height = self.image_canvas.winfo_height()
+        if canvas_width <= 1:  # キャンバスがまだ正しいサイズを持っていない場合
+            canvas_width = 300
+            canvas_height = 300
+
+        # キャンバスのサイズを更新（必要な場合）
+        if self.show_full_image_var.get():
+            self.image_canvas.config(
+                width=max(canvas_width, photo.width()),
+                height=max(canvas_height, photo.height())
+            )
+        
+        # 画像をキャンバスの中央に配置
+        x = (self.image_canvas.winfo_width() - photo.width()) // 2
+        y = (self.image_canvas.winfo_height() - photo.height()) // 2
+        
+        # 画像の表示
+        self.image_canvas.create_image(x, y, image=photo, anchor=tk.NW)
+        self.image_canvas.image = photo  # 参照を保持
+        
+        # 画像情報の表示
+        info_text = f"ImageType/画像タイプ: {image_type}\n"
+        info_text += f"Size/サイズ: {image_size[0]}x{image_size[1]} px\n"
+        info_text += f"Mode/モード: {image_mode}"
+        self.image_info_label.config(text=info_text)
 
 if __name__ == "__main__":
     app = LineDBViewer()
@@ -2,25 +2,48 @@
 ユーティリティ関数モジュール
 """
 
-from .time_utils import unix_micro_to_jst, convert_timestamp
+from .time_utils import unix_micro_to_jst, convert_timestamp, convert_timestamps, parse_timestamp, format_timestamp
 from .database_utils import (
     connect_database,
     get_all_tables,
     get_table_info,
+    get_table_xinfo,
+    get_column_samples,
     get_table_row_count,
     get_table_contents,
-    check_deleted_messages
+    check_deleted_messages,
+    build_search_index,
+    search_index,
+    get_table_row_counts,
+    estimate_table_row_counts,
+    load_row_count_cache,
+    save_row_count_cache
 )
 from .export_utils import export_to_excel
+from .hex_utils import hex_dump_lines
+from .image_utils import detect_image_type
 
 __all__ = [
     'unix_micro_to_jst',
     'convert_timestamp',
+    'convert_timestamps',
+    'parse_timestamp',
+    'format_timestamp',
     'connect_database',
     'get_all_tables',
     'get_table_info',
+    'get_table_xinfo',
+    'get_column_samples',
     'get_table_row_count',
     'get_table_contents',
     'check_deleted_messages',
-    'export_to_excel'
+    'build_search_index',
+    'search_index',
+    'get_table_row_counts',
+    'estimate_table_row_counts',
+    'load_row_count_cache',
+    'save_row_count_cache',
+    'export_to_excel',
+    'hex_dump_lines',
+    'detect_image_type'
 ] 
\ No newline at end of file
@@ -10,17 +10,51 @@ SQLiteデータベースへの接続、テーブル情報の取得、データ
 - テーブル一覧・情報の取得
 - テーブルデータの取得
 - 削除メッセージの検索
+- 全文検索インデックスの作成・検索
+- テーブル行数の一括取得・推定とキャッシュ
 """
 
 import sqlite3
-from typing import Tuple, List, Optional, Any, Dict, Set
+import json
+import atexit
+from typing import Tuple, List, Optional, Any, Dict, Set, Iterable, Sequence
 import os
+import sys
+from pathlib import Path
 
-def connect_database(db_path: str) -> Tuple[Optional[sqlite3.Connection], Optional[sqlite3.Cursor]]:
+# 全文検索インデックス（trigram）で検索できる最小文字数
+SEARCH_INDEX_MIN_LENGTH = 3
+
+# 1回のクエリで行数を推定するテーブル数（SQLiteの複合SELECTの上限500未満）
+ROW_COUNT_BATCH_SIZE = 200
+
+# 閲覧用の接続で設定するPRAGMA（読み取り中心のため、ページキャッシュを大きく取る）
+READ_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY;\n"
+    "PRAGMA cache_size=-65536;\n"  # 64MB
+)
+
+# メモリマップI/Oのサイズ（32bit環境ではアドレス空間を圧迫するため使用しない）
+MMAP_SIZE = 268435456 if sys.maxsize > 2**32 else 0
+
+# WALファイル用の接続（パスごとに1つを使い回し、終了時にまとめて閉じる）
+_WAL_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+
+def connect_database(db_path: str, check_same_thread: bool = True,
+                     read_only: bool = False) -> Tuple[Optional[sqlite3.Connection], Optional[sqlite3.Cursor]]:
     """データベースに接続します。
 
+    read_only=True の場合は読み取り専用（mode=ro, query_only）で開き、閲覧向けの
+    PRAGMA（temp_store, cache_size, mmap_size）を設定します。解析対象のファイルを
+    変更しないよう journal_mode・synchronous は変更しません。さらにファイルが
+    書き込み不可でWALファイルもない場合（読み取り専用メディア上のバックアップなど）は
+    immutable=1 で開き、ロックや変更確認を省略します。
+
     Args:
         db_path (str): データベースファイルのパス
+        check_same_thread (bool): 作成スレッド以外からの使用を禁止するか
+            （ワーカースレッドで開いた接続を終了時に閉じる場合はFalse）
+        read_only (bool): 読み取り専用で開くか
 
     Returns:
         Tuple[Optional[sqlite3.Connection], Optional[sqlite3.Cursor]]: 
@@ -34,8 +68,20 @@ def connect_database(db_path: str) -> Tuple[Optional[sqlite3.Connection], Option
         ...     conn.close()
     """
     try:
-        conn = sqlite3.connect(db_path)
+        if not read_only:
+            conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
+            return conn, conn.cursor()
+
+        uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+        if not os.access(db_path, os.W_OK) and not os.path.exists(db_path + "-wal"):
+            uri += "&immutable=1"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
         cursor = conn.cursor()
+
+        pragmas = READ_PRAGMAS
+        if MMAP_SIZE:
+            pragmas += f"PRAGMA mmap_size={MMAP_SIZE};\n"
+        cursor.executescript(pragmas + "PRAGMA query_only=1;")
         return conn, cursor
     except Exception as e:
         print(f"Database connection error: {e}")
@@ -79,15 +125,69 @@ def get_table_info(cursor: sqlite3.Cursor, table_name: str) -> List[tuple]:
         >>> for col in info:
         ...     print(f"カラム名: {col[1]}, 型: {col[2]}")
     """
-    cursor.execute(f"PRAGMA table_info({table_name})")
+    cursor.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
     return cursor.fetchall()
 
-def get_table_row_count(cursor: sqlite3.Cursor, table_name: str) -> int:
+def get_table_xinfo(cursor: sqlite3.Cursor, table_name: str) -> List[tuple]:
+    """テーブルのカラム情報を、生成カラム・非表示カラムを含めて取得します。
+
+    Args:
+        cursor (sqlite3.Cursor): データベースカーソル
+        table_name (str): テーブル名
+
+    Returns:
+        List[tuple]: カラム情報のリスト
+            各タプルは (id, name, type, notnull, default_value, primary_key, hidden) を含みます。
+            hidden は 0: 通常, 1: 仮想テーブルの非表示カラム, 2/3: 生成カラム です。
+
+    Examples:
+        >>> info = get_table_xinfo(cursor, "ZMESSAGE")
+        >>> for col in info:
+        ...     print(f"カラム名: {col[1]}, 既定値: {col[4]}")
+    """
+    cursor.execute(f"PRAGMA table_xinfo({quote_identifier(table_name)})")
+    return cursor.fetchall()
+
+def get_column_samples(cursor: sqlite3.Cursor, table_name: str,
+                       column_names: List[str]) -> Dict[str, Any]:
+    """指定カラムについて、NULLでない最初の値を1回のクエリで取得します。
+
+    行全体（大きなBLOBを含む場合がある）を読み込まずに、必要なカラムだけを取得します。
+
+    Args:
+        cursor (sqlite3.Cursor): データベースカーソル
+        table_name (str): テーブル名
+        column_names (List[str]): サンプル値を取得するカラム名のリスト
+
+    Returns:
+        Dict[str, Any]: カラム名とサンプル値の辞書（値がない場合はNone）
+
+    Examples:
+        >>> samples = get_column_samples(cursor, "ZMESSAGE", ["ZTIMESTAMP"])
+        >>> print(samples["ZTIMESTAMP"])
+    """
+    if not column_names:
+        return {}
+
+    table = quote_identifier(table_name)
+    subqueries = ", ".join(
+        f"(SELECT {col} FROM {table} WHERE {col} IS NOT NULL LIMIT 1)"
+        for col in map(quote_identifier, column_names)
+    )
+    cursor.execute(f"SELECT {subqueries}")
+    return dict(zip(column_names, cursor.fetchone()))
+
+def get_table_row_count(cursor: sqlite3.Cursor, table_name: str, estimate: bool = False) -> int:
     """テーブルの総行数を取得します。
 
+    estimate=True の場合は、ANALYZE で作成された sqlite_stat1 の統計値（先頭の数値が
+    テーブルの行数）を返し、全件走査を行いません。統計がない場合は COUNT(*) で数えます。
+    統計値は ANALYZE 実行時点のものなので、実際の行数と異なることがあります。
+
     Args:
         cursor (sqlite3.Cursor): データベースカーソル
         table_name (str): テーブル名
+        estimate (bool): sqlite_stat1 の推定値を優先するかどうか
 
     Returns:
         int: テーブルの行数
@@ -96,12 +196,138 @@ def get_table_row_count(cursor: sqlite3.Cursor, table_name: str) -> int:
         >>> count = get_table_row_count(cursor, "ZMESSAGE")
         >>> print(f"メッセージ数: {count}")
     """
+    if estimate:
+        try:
+            row = cursor.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1", (table_name,)
+            ).fetchone()
+            if row and row[0]:
+                return int(row[0].split(None, 1)[0])
+        except (sqlite3.Error, ValueError):
+            # sqlite_stat1 がない（ANALYZE未実行）または統計値が数値でない
+            pass
     try:
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+        cursor.execute(f"SELECT COUNT(*) FROM {quote_identifier(table_name)}")
         return cursor.fetchone()[0]
     except sqlite3.Error:
         return 0
 
+def quote_identifier(name: str) -> str:
+    """テーブル名・カラム名をSQLの識別子として引用符で囲みます。
+
+    Args:
+        name (str): テーブル名またはカラム名
+
+    Returns:
+        str: ダブルクォートで囲んだ識別子（内部の"はエスケープ）
+
+    Examples:
+        >>> quote_identifier('ZMESSAGE')
+        '"ZMESSAGE"'
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+def get_table_row_counts(cursor: sqlite3.Cursor, tables: List[str]) -> Dict[str, int]:
+    """複数テーブルの正確な行数を、まとめて1回のクエリで取得します。
+
+    テーブルごとに COUNT(*) を実行する代わりに UNION ALL で1つのクエリにまとめます。
+    クエリが失敗した場合はテーブルごとに get_table_row_count() で取得します。
+
+    Args:
+        cursor (sqlite3.Cursor): データベースカーソル
+        tables (List[str]): テーブル名のリスト
+
+    Returns:
+        Dict[str, int]: テーブル名と行数の辞書
+
+    Examples:
+        >>> counts = get_table_row_counts(cursor, ["ZMESSAGE", "ZCHAT"])
+        >>> print(counts["ZCHAT"])
+    """
+    counts = {}
+    for i in range(0, len(tables), ROW_COUNT_BATCH_SIZE):
+        batch = tables[i:i + ROW_COUNT_BATCH_SIZE]
+        query = " UNION ALL ".join(
+            f"SELECT ?, COUNT(*) FROM {quote_identifier(table)}" for table in batch
+        )
+        try:
+            cursor.execute(query, batch)
+            counts.update(cursor.fetchall())
+        except sqlite3.Error:
+            for table in batch:
+                counts[table] = get_table_row_count(cursor, table)
+    return counts
+
+def estimate_table_row_counts(cursor: sqlite3.Cursor, tables: List[str]) -> Dict[str, int]:
+    """各テーブルの行数を max(rowid) で推定します。
+
+    COUNT(*) による全件走査の代わりに、B-treeの末尾を参照するだけの max(rowid) を
+    まとめて1回のクエリで取得します。削除された行がある場合は実際の行数より
+    大きくなるため、正確な行数が必要な場合は get_table_row_count() を使用してください。
+    rowidを持たないテーブル（WITHOUT ROWID）は COUNT(*) で数えます。
+
+    Args:
+        cursor (sqlite3.Cursor): データベースカーソル
+        tables (List[str]): テーブル名のリスト
+
+    Returns:
+        Dict[str, int]: テーブル名と推定行数の辞書
+
+    Examples:
+        >>> counts = estimate_table_row_counts(cursor, ["ZMESSAGE", "ZCHAT"])
+        >>> print(counts["ZMESSAGE"])
+    """
+    counts = {}
+    for i in range(0, len(tables), ROW_COUNT_BATCH_SIZE):
+        batch = tables[i:i + ROW_COUNT_BATCH_SIZE]
+        query = " UNION ALL ".join(
+            f"SELECT ?, (SELECT max(rowid) FROM {quote_identifier(table)})" for table in batch
+        )
+        try:
+            cursor.execute(query, batch)
+            for table, max_rowid in cursor.fetchall():
+                counts[table] = max_rowid or 0
+        except sqlite3.Error:
+            # WITHOUT ROWIDのテーブルが含まれる場合はテーブルごとに取得
+            for table in batch:
+                try:
+                    cursor.execute(f"SELECT max(rowid) FROM {quote_identifier(table)}")
+                    counts[table] = cursor.fetchone()[0] or 0
+                except sqlite3.Error:
+                    counts[table] = get_table_row_count(cursor, table, estimate=True)
+    return counts
+
+def load_row_count_cache(cache_path: str) -> Dict[str, Dict[str, Any]]:
+    """行数キャッシュをJSONファイルから読み込みます。
+
+    Args:
+        cache_path (str): キャッシュファイルのパス
+
+    Returns:
+        Dict[str, Dict[str, Any]]: データベースのパスをキーとするキャッシュ
+            各値は {"mtime": 更新時刻, "counts": {テーブル名: 行数}, "exact": [正確な行数のテーブル名]} です。
+            ファイルが存在しない・読み込めない場合は空の辞書を返します。
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_row_count_cache(cache_path: str, cache: Dict[str, Dict[str, Any]]) -> None:
+    """行数キャッシュをJSONファイルに保存します。
+
+    Args:
+        cache_path (str): キャッシュファイルのパス
+        cache (Dict[str, Dict[str, Any]]): load_row_count_cache() と同じ形式のキャッシュ
+    """
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"行数キャッシュの保存エラー: {e}")
+
 def get_wal_data(db_path: str, table_name: str) -> List[Tuple]:
     """
     Read data from WAL file if it exists
@@ -109,26 +335,42 @@ def get_wal_data(db_path: str, table_name: str) -> List[Tuple]:
     """
     wal_path = db_path + "-wal"
     if not os.path.exists(wal_path):
+        # WALファイルがなくなった場合は使い回していた接続も閉じる
+        wal_conn = _WAL_CONNECTIONS.pop(wal_path, None)
+        if wal_conn is not None:
+            wal_conn.close()
         return []
     
     try:
-        # WALファイル用の接続を作成（読み取り専用）
-        wal_conn = sqlite3.connect(f"file:{wal_path}?mode=ro", uri=True)
-        wal_cursor = wal_conn.cursor()
+        # WALファイル用の接続を取得（読み取り専用、初回のみ作成）
+        wal_conn = _WAL_CONNECTIONS.get(wal_path)
+        if wal_conn is None:
+            wal_conn = sqlite3.connect(f"file:{wal_path}?mode=ro", uri=True, check_same_thread=False)
+            try:
+                wal_conn.executescript(READ_PRAGMAS + "PRAGMA query_only=1;")
+                # ヘッダーを読み、SQLiteのデータベースとして開けることを確認してから使い回す
+                wal_conn.execute("PRAGMA schema_version").fetchone()
+            except Exception:
+                # 通常の-walファイルはデータベースではないため、ここで失敗する（接続を残さない）
+                wal_conn.close()
+                raise
+            _WAL_CONNECTIONS[wal_path] = wal_conn
         
         # WALからデータを取得
-        wal_cursor.execute(f"SELECT * FROM {table_name}")
-        wal_data = wal_cursor.fetchall()
-        
-        wal_cursor.close()
-        wal_conn.close()
-        
-        return wal_data
+        return wal_conn.execute(f"SELECT * FROM {quote_identifier(table_name)}").fetchall()
     except Exception as e:
         print(f"WAL reading error: {e}")
         return []
 
-def get_table_contents_with_wal(cursor: sqlite3.Cursor, table_name: str, db_path: str, limit: Optional[int] = None) -> Tuple[List[str], List[Tuple], Set[str]]:
+def close_wal_connections() -> None:
+    """使い回しているWALファイル用の接続をすべて閉じます（終了時に自動で呼ばれます）。"""
+    while _WAL_CONNECTIONS:
+        _, wal_conn = _WAL_CONNECTIONS.popitem()
+        wal_conn.close()
+
+atexit.register(close_wal_connections)
+
+def get_table_contents_with_wal(cursor: sqlite3.Cursor, table_name: str, db_path: str, limit: Optional[int] = None) -> Tuple[List[str], List[Tuple], Set[int]]:
     """
     Get table contents including WAL data
     テーブルの内容をWALデータと共に取得
@@ -137,22 +379,21 @@ def get_table_contents_with_wal(cursor: sqlite3.Cursor, table_name: str, db_path
         Tuple containing:
         - List of column names
         - List of rows
-        - Set of primary keys from WAL-only data
+        - Set of row indices (into the returned rows) of WAL-only data
+          WALのみに存在する行の行番号（返却する行リスト内の位置）
     """
     try:
-        # Get column information
-        cursor.execute(f"PRAGMA table_info({table_name})")
-        columns = [col[1] for col in cursor.fetchall()]
-        
-        # Get primary key column
-        cursor.execute(f"PRAGMA table_info({table_name})")
-        pk_columns = [col[1] for col in cursor.fetchall() if col[5]]  # col[5] is pk flag
+        # Get column information and primary key columns (one PRAGMA call)
+        table_info = cursor.execute(f"PRAGMA table_info({quote_identifier(table_name)})").fetchall()
+        columns = [col[1] for col in table_info]
+        pk_columns = [col[1] for col in table_info if col[5]]  # col[5] is pk flag
         
         # Get main database data
+        quoted_name = quote_identifier(table_name)
         if limit:
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT {limit}")
+            cursor.execute(f"SELECT * FROM {quoted_name} LIMIT ?", (limit,))
         else:
-            cursor.execute(f"SELECT * FROM {table_name}")
+            cursor.execute(f"SELECT * FROM {quoted_name}")
         db_data = cursor.fetchall()
         
         # Get WAL data
@@ -160,7 +401,7 @@ def get_table_contents_with_wal(cursor: sqlite3.Cursor, table_name: str, db_path
         
         # Create sets of primary keys for comparison
         db_keys = set()
-        wal_only_keys = set()
+        wal_only_rows = set()
         
         if pk_columns:
             pk_indices = [columns.index(pk_col) for pk_col in pk_columns]
@@ -174,14 +415,14 @@ def get_table_contents_with_wal(cursor: sqlite3.Cursor, table_name: str, db_path
             for row in wal_data:
                 key = tuple(row[idx] for idx in pk_indices)
                 if key not in db_keys:
-                    wal_only_keys.add(key)
+                    wal_only_rows.add(len(db_data))
                     db_data.append(row)
         else:
             # If no primary key, treat all WAL data as new
             db_data.extend(wal_data)
-            wal_only_keys = set(range(len(db_data) - len(wal_data), len(db_data)))
+            wal_only_rows = set(range(len(db_data) - len(wal_data), len(db_data)))
         
-        return columns, db_data, wal_only_keys
+        return columns, db_data, wal_only_rows
     
     except Exception as e:
         print(f"Error getting table contents with WAL: {e}")
@@ -206,7 +447,7 @@ def check_deleted_messages(cursor: sqlite3.Cursor, table_name: str) -> List[tupl
     try:
         cursor.execute(f"""
             SELECT ZTIMESTAMP, ZTEXT, Z_PK 
-            FROM {table_name} 
+            FROM {quote_identifier(table_name)} 
             WHERE Z_OPT = 1 
             AND ZTEXT IS NOT NULL 
             ORDER BY ZTIMESTAMP DESC
@@ -240,21 +481,99 @@ def get_table_contents(cursor: sqlite3.Cursor, table_name: str,
     """
     try:
         # カラム名を取得
-        cursor.execute(f"PRAGMA table_info({table_name})")
+        quoted_name = quote_identifier(table_name)
+        cursor.execute(f"PRAGMA table_info({quoted_name})")
         columns = [col[1] for col in cursor.fetchall()]
         
-        # クエリを構築
-        query = f"SELECT * FROM {table_name}"
+        # クエリを構築（値はプレースホルダで渡し、同じSQL文の準備済みステートメントを再利用させる）
+        query = f"SELECT * FROM {quoted_name}"
+        params: List[int] = []
         if start_pk is not None and end_pk is not None:
-            query += f" WHERE Z_PK BETWEEN {start_pk} AND {end_pk}"
+            query += " WHERE Z_PK BETWEEN ? AND ?"
+            params += [start_pk, end_pk]
         if limit is not None:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ?"
+            params.append(limit)
             
         # データを取得
-        cursor.execute(query)
+        cursor.execute(query, params)
         rows = cursor.fetchall()
         
         return columns, rows
     except sqlite3.Error as e:
         print(f"テーブル内容の取得エラー: {e}")
-        return [], [] 
\ No newline at end of file
+        return [], []
+
+def build_search_index(rows: Iterable[Sequence[Any]], column_count: int) -> Optional[sqlite3.Connection]:
+    """検索用の全文検索インデックス（FTS5）を作成します。
+
+    元のデータベースを変更しないよう、別のインメモリ接続上に作成します。
+    trigramトークナイザを使用するため、分かち書きのない日本語でも部分一致で検索できます。
+    各値は str() で文字列化して登録されます（NULLは "None"）。
+
+    Args:
+        rows (Iterable[Sequence[Any]]): 行データ（先頭からの行番号がrowidになります）
+        column_count (int): カラム数
+
+    Returns:
+        Optional[sqlite3.Connection]: インデックスを保持する接続。
+            FTS5が利用できない場合などはNoneを返します。
+
+    Examples:
+        >>> index = build_search_index([("こんにちは", 1)], 2)
+        >>> search_index(index, "にちは")
+        {0}
+    """
+    if column_count <= 0:
+        return None
+
+    col_names = ", ".join(f"c{i}" for i in range(column_count))
+    placeholders = ", ".join("?" * (column_count + 1))
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute(f"CREATE VIRTUAL TABLE search_fts USING fts5({col_names}, tokenize='trigram')")
+        # 単一トランザクションで一括登録
+        with conn:
+            conn.executemany(
+                f"INSERT INTO search_fts(rowid, {col_names}) VALUES ({placeholders})",
+                ((index, *map(str, row)) for index, row in enumerate(rows))
+            )
+        return conn
+    except sqlite3.Error as e:
+        print(f"検索インデックスの作成エラー: {e}")
+        conn.close()
+        return None
+
+def search_index(index_conn: sqlite3.Connection, text: str,
+                 column: Optional[int] = None) -> Optional[Set[int]]:
+    """全文検索インデックスから、指定文字列を含む行番号を取得します。
+
+    大文字小文字を区別しない部分一致の結果を返すため、結果は候補です。
+    完全一致・前方一致などの条件は呼び出し側で確認してください。
+
+    Args:
+        index_conn (sqlite3.Connection): build_search_index() で作成した接続
+        text (str): 検索文字列
+        column (Optional[int]): 検索対象のカラム番号（Noneの場合はすべて）
+
+    Returns:
+        Optional[Set[int]]: 候補の行番号の集合。
+            インデックスで検索できない場合（3文字未満など）はNoneを返します。
+
+    Examples:
+        >>> candidates = search_index(index, "スタンプ", column=2)
+    """
+    if len(text) < SEARCH_INDEX_MIN_LENGTH:
+        return None
+
+    # フレーズとして検索（"はエスケープ）
+    query = '"' + text.replace('"', '""') + '"'
+    if column is not None:
+        query = f"c{column} : {query}"
+
+    try:
+        cursor = index_conn.execute("SELECT rowid FROM search_fts WHERE search_fts MATCH ?", (query,))
+        return {row[0] for row in cursor}
+    except sqlite3.Error as e:
+        print(f"検索インデックスの検索エラー: {e}")
+        return None
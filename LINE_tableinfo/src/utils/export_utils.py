@@ -3,39 +3,53 @@ Excel export utility module for LINE Database Viewer
 
 This module provides functionality to export database table contents
 to Excel format.
+
+Rows are streamed from the cursor directly into xlsxwriter in
+constant-memory mode, so large tables are never loaded into memory at once.
 """
 
 import os
 from datetime import datetime
-import pandas as pd
 import sqlite3
-from typing import Optional
+import xlsxwriter
+from typing import Optional, Callable
+
+from .database_utils import quote_identifier
+
+# 進捗を通知する行数の間隔
+PROGRESS_INTERVAL = 10000
 
-def export_to_excel(cursor: sqlite3.Cursor, table_name: str) -> Optional[str]:
+# Excelのカラム幅の上限（文字数）
+MAX_COLUMN_WIDTH = 50
+
+# 1回の fetchmany() で取得する行数（メモリ上に保持するのはこの行数まで）
+FETCH_SIZE = 10000
+
+def export_to_excel(cursor: sqlite3.Cursor, table_name: str,
+                    progress_callback: Optional[Callable[[int], None]] = None) -> Optional[str]:
     """
     Export table contents to Excel file.
     
     Args:
         cursor (sqlite3.Cursor): Database cursor
         table_name (str): Name of the table to export
+        progress_callback (Optional[Callable[[int], None]]): Called with the number of
+            rows written every PROGRESS_INTERVAL rows
         
     Returns:
         Optional[str]: Path to the exported Excel file if successful, None otherwise
     """
     try:
         # テーブルの内容を取得
-        cursor.execute(f"SELECT * FROM {table_name}")
-        rows = cursor.fetchall()
+        cursor.execute(f"SELECT * FROM {quote_identifier(table_name)}")
+        first_row = cursor.fetchone()
         
-        if not rows:
+        if first_row is None:
             return None
             
         # カラム名を取得
         columns = [description[0] for description in cursor.description]
         
-        # DataFrameを作成
-        df = pd.DataFrame(rows, columns=columns)
-        
         # 出力ディレクトリを作成
         output_dir = "exports"
         os.makedirs(output_dir, exist_ok=True)
@@ -44,11 +58,51 @@ def export_to_excel(cursor: sqlite3.Cursor, table_name: str) -> Optional[str]:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         excel_file = os.path.join(output_dir, f"{table_name}_{timestamp}.xlsx")
         
-        # Excelファイルに出力
-        df.to_excel(excel_file, index=False, engine='openpyxl')
+        # Excelファイルに出力（行をカーソルから直接書き込み、メモリ上に保持しない）
+        workbook = xlsxwriter.Workbook(excel_file, {
+            'constant_memory': True,
+            'use_zip64': True,  # 4GBを超えるファイルにも対応
+            'strings_to_urls': False,
+            'strings_to_formulas': False,  # "="で始まる値も文字列のまま出力
+            'nan_inf_to_errors': True
+        })
+        try:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, columns)
+
+            # カラム幅は書き込みと同時に計測（2回目の走査は不要）
+            widths = [len(str(col)) for col in columns]
+
+            # FETCH_SIZE行ずつ取得して書き込む
+            row_num = 0
+            batch = [first_row]
+            while batch:
+                for row in batch:
+                    row_num += 1
+                    values = [
+                        value.hex() if isinstance(value, (bytes, bytearray, memoryview)) else value
+                        for value in row
+                    ]
+                    worksheet.write_row(row_num, 0, values)
+
+                    for i, value in enumerate(values):
+                        if value is not None:
+                            length = len(value) if isinstance(value, str) else len(str(value))
+                            if length > widths[i]:
+                                widths[i] = length
+
+                    if progress_callback and row_num % PROGRESS_INTERVAL == 0:
+                        progress_callback(row_num)
+
+                batch = cursor.fetchmany(FETCH_SIZE)
+
+            for i, width in enumerate(widths):
+                worksheet.set_column(i, i, min(width + 2, MAX_COLUMN_WIDTH))
+        finally:
+            workbook.close()
         
         return excel_file
         
     except Exception as e:
         print(f"Error exporting to Excel: {e}")
-        return None 
\ No newline at end of file
+        return None
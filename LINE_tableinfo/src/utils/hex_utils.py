@@ -0,0 +1,52 @@
+"""
+HEX表示ユーティリティ
+
+このモジュールは、バイナリデータ（BLOB）をHEXダンプ形式に変換するための
+関数を提供します。
+
+主な機能：
+- HEXダンプ（オフセット・16進数・ASCII）の行データ生成
+
+1バイトごとのPythonループではなく、bytes.hex() と bytes.translate() で
+データ全体を一度に変換するため、数MBのデータでも高速に処理できます。
+"""
+
+from typing import List, Tuple
+
+# 表示可能なASCII文字（0x20-0x7E）以外を "." に置き換える変換テーブル
+ASCII_TABLE = bytes(c if 32 <= c < 127 else 46 for c in range(256))
+
+def hex_dump_lines(data: bytes, bytes_per_line: int = 16,
+                   start_offset: int = 0) -> List[Tuple[int, str, str]]:
+    """バイト列をHEXダンプの行データに変換します。
+
+    16進数部分は8バイトごとに空白を1つ追加し、不足分は空白で埋めて
+    1行分のデータがある行と同じ幅（16バイトの場合は48文字）に揃えます。
+    データの一部を変換する場合は、start_offset に元データでの開始位置を指定します。
+
+    Args:
+        data (bytes): 変換するデータ
+        bytes_per_line (int): 1行あたりのバイト数
+        start_offset (int): 表示するオフセットの開始値
+
+    Returns:
+        List[Tuple[int, str, str]]: 各行の (オフセット, 16進数文字列, ASCII文字列) のリスト
+
+    Examples:
+        >>> hex_dump_lines(b'LINE')
+        [(0, '4C 49 4E 45                                     ', 'LINE')]
+    """
+    hex_all = data.hex(' ').upper()
+    ascii_all = data.translate(ASCII_TABLE).decode('ascii')
+    half = bytes_per_line // 2
+    # 1行分の16進数部分の幅（"XX " × バイト数 - 末尾の空白 + 中央の空白）
+    line_width = bytes_per_line * 3
+
+    lines = []
+    for offset in range(0, len(data), bytes_per_line):
+        count = min(bytes_per_line, len(data) - offset)
+        hex_line = hex_all[offset * 3:(offset + count) * 3 - 1]
+        if count > half:
+            hex_line = hex_line[:half * 3] + ' ' + hex_line[half * 3:]
+        lines.append((start_offset + offset, hex_line.ljust(line_width), ascii_all[offset:offset + count]))
+    return lines
@@ -0,0 +1,57 @@
+"""
+画像判定ユーティリティ
+
+このモジュールは、バイナリデータ（BLOB）が画像かどうかを先頭のマジックナンバーから
+判定するための関数を提供します。
+
+主な機能：
+- 画像形式の判定（JPEG, PNG, GIF, BMP, ICO, TIFF, PSD, WebP）
+
+シグネチャはあらかじめ先頭1バイトで振り分けておき、候補となる形式のみを照合します。
+"""
+
+from typing import Dict, Optional, Tuple
+
+# 主要な画像形式のマジックナンバー（ファイル先頭のバイト列）と形式名
+IMAGE_SIGNATURES: Tuple[Tuple[bytes, str], ...] = (
+    (b'\xff\xd8\xff', 'JPEG'),
+    (b'\x89PNG\r\n\x1a\n', 'PNG'),
+    (b'GIF89a', 'GIF(GIF89a)'),
+    (b'GIF87a', 'GIF(GIF87a)'),
+    (b'BM', 'BMP'),
+    (b'\x00\x00\x01\x00', 'ICO'),
+    (b'II*\x00', 'TIFF'),
+    (b'MM\x00*', 'TIFF'),
+    (b'8BPS', 'PSD'),
+    (b'RIFF', 'Webp'),  # RIFFコンテナのうち、形式名（8-12バイト目）がWEBPのもの
+)
+
+# 先頭1バイトごとの候補シグネチャ（シグネチャ, 長さ, 形式名）
+# 長さをあらかじめ求めておき、照合はスライスの比較で行う（startswith より呼び出しが軽い）
+FIRST_BYTE_DISPATCH: Dict[int, Tuple[Tuple[bytes, int, str], ...]] = {}
+for _signature, _image_type in IMAGE_SIGNATURES:
+    FIRST_BYTE_DISPATCH[_signature[0]] = (
+        FIRST_BYTE_DISPATCH.get(_signature[0], ()) + ((_signature, len(_signature), _image_type),)
+    )
+
+def detect_image_type(data: bytes) -> Optional[str]:
+    """バイト列の先頭から画像形式を判定します。
+
+    Args:
+        data (bytes): 判定するデータ
+
+    Returns:
+        Optional[str]: 画像形式名。画像でない場合はNone
+
+    Examples:
+        >>> detect_image_type(b'\\x89PNG\\r\\n\\x1a\\n' + b'\\x00' * 8)
+        'PNG'
+    """
+    if not data:
+        return None
+    for signature, length, image_type in FIRST_BYTE_DISPATCH.get(data[0], ()):
+        if data[:length] == signature:
+            if image_type == 'Webp' and data[8:12] != b'WEBP':
+                continue
+            return image_type
+    return None
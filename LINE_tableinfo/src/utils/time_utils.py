@@ -11,7 +11,19 @@
 
 import pytz
 from datetime import datetime, timedelta
-from typing import Union, Optional
+from functools import lru_cache
+from typing import Union, Optional, Any, Callable, Iterable, List
+
+# 日本時間（呼び出しごとに取得しない）
+JST = pytz.timezone('Asia/Tokyo')
+
+# 各タイムスタンプ形式の基準日時
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=pytz.UTC)
+MAC_EPOCH = datetime(2001, 1, 1, tzinfo=pytz.UTC)
+WEBKIT_EPOCH = datetime(1601, 1, 1, tzinfo=pytz.UTC)
+
+# 日時文字列の書式
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 def unix_micro_to_jst(unix_milli: Union[int, float]) -> str:
     """UNIXマイクロ秒タイムスタンプをJST時間に変換します。
@@ -29,13 +41,122 @@ def unix_micro_to_jst(unix_milli: Union[int, float]) -> str:
     """
     try:
         unix_seconds = unix_milli / 1000  # ミリ秒から秒に変換
-        utc_time = datetime.fromtimestamp(unix_seconds, tz=pytz.UTC)
-        jst = pytz.timezone('Asia/Tokyo')
-        jst_time = utc_time.astimezone(jst)
-        return jst_time.strftime('%Y-%m-%d %H:%M:%S')
+        return datetime.fromtimestamp(unix_seconds, tz=JST).strftime(DATETIME_FORMAT)
     except Exception as e:
         return f"変換エラー: {e}"
 
+@lru_cache(maxsize=None)
+def _get_timezone(name: str):
+    """タイムゾーンを取得します（名前ごとにキャッシュ）。"""
+    return pytz.timezone(name)
+
+def parse_timestamp(value: Any) -> Optional[int]:
+    """タイムスタンプの値を数値に変換します。
+
+    同じ値を複数の形式で表示する場合は、この関数で1回だけ変換し、
+    結果を format_timestamp() に渡してください。
+
+    Args:
+        value (Any): 変換する値（数値、または数値を表す文字列）
+
+    Returns:
+        Optional[int]: 数値（float の場合はそのまま）。数値として解釈できない場合はNone
+
+    Examples:
+        >>> parse_timestamp("1704034800000")
+        1704034800000
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    try:
+        return int(str(value).replace('➡', ''))
+    except (ValueError, TypeError):
+        return None
+
+# 基準日時からの経過時間で表す形式（基準日時, 1単位あたりのマイクロ秒数）
+# いずれも日本時間で表示する
+EPOCH_FORMATS = {
+    "UNIX_second": (UNIX_EPOCH, 1000000),
+    "UNIX_millisecond": (UNIX_EPOCH, 1000),
+    "UNIX_microsecond": (UNIX_EPOCH, 1),
+    "FIREFOX": (UNIX_EPOCH, 1),       # FirefoxのPRTimeもUNIXマイクロ秒
+    "MAC": (MAC_EPOCH, 1),            # HFS+/Cocoaタイムスタンプ（2001年1月1日から、マイクロ秒として扱う）
+    "COCOA": (MAC_EPOCH, 1),
+    "WEBKIT": (WEBKIT_EPOCH, 1),      # WebKit/Chromeタイムスタンプ（1601年1月1日からのマイクロ秒）
+    "CHROME": (WEBKIT_EPOCH, 1),
+    "FILETIME": (WEBKIT_EPOCH, 0.1),  # Windowsファイルタイム（1601年1月1日からの100ナノ秒単位）
+}
+
+@lru_cache(maxsize=None)
+def _get_formatter(format_type: str) -> Callable[[Union[int, float]], str]:
+    """形式ごとの変換関数を取得します（形式の判定は形式ごとに1回だけ行う）。"""
+    if format_type == "JST":
+        return unix_micro_to_jst
+    elif format_type == "UNIX":
+        return str
+    elif format_type == "UNIX_SEC":
+        return lambda value: str(value // 1000000)  # マイクロ秒から秒に変換
+
+    if format_type in EPOCH_FORMATS:
+        epoch, unit = EPOCH_FORMATS[format_type]
+        return lambda value: (epoch + timedelta(microseconds=value * unit)).astimezone(JST).strftime(DATETIME_FORMAT)
+
+    # タイムゾーン名（UTC, GMT, Asia/Tokyo など）：ミリ秒としてそのタイムゾーンで表示
+    try:
+        tz = _get_timezone(format_type)
+    except pytz.UnknownTimeZoneError:
+        return str
+    return lambda value: (UNIX_EPOCH + timedelta(milliseconds=value)).astimezone(tz).strftime(DATETIME_FORMAT)
+
+def format_timestamp(value: Union[int, float], format_type: str) -> str:
+    """数値のタイムスタンプを指定された形式の文字列にします。
+
+    Args:
+        value (Union[int, float]): parse_timestamp() で変換した数値
+        format_type (str): 変換後の形式（convert_timestamp() を参照）
+
+    Returns:
+        str: 変換後の文字列
+        エラーの場合はエラーメッセージを返します。
+    """
+    try:
+        return _get_formatter(format_type)(value)
+    except Exception as e:
+        return f"変換エラー: {str(e)}"
+
+def convert_timestamps(values: Iterable[Any], format_type: str) -> List[Optional[str]]:
+    """複数の値（1カラム分など）をまとめて指定された形式に変換します。
+
+    形式の判定と変換関数の取得は1回だけ行います。NULL（None）はそのまま返します。
+
+    Args:
+        values (Iterable[Any]): 変換する値
+        format_type (str): 変換後の形式（convert_timestamp() を参照）
+
+    Returns:
+        List[Optional[str]]: 変換後の文字列のリスト（convert_timestamp() と同じ結果）
+
+    Examples:
+        >>> convert_timestamps([1704034800000, None], "JST")
+        ['2024-01-01 00:00:00', None]
+    """
+    formatter = _get_formatter(format_type)
+    results: List[Optional[str]] = []
+    append = results.append
+    for value in values:
+        if value is None:
+            append(None)
+            continue
+        parsed = parse_timestamp(value)
+        if parsed is None:
+            append(str(value))
+            continue
+        try:
+            append(formatter(parsed))
+        except Exception as e:
+            append(f"変換エラー: {str(e)}")
+    return results
+
 def convert_timestamp(value: Union[int, float, str], format_type: str) -> str:
     """各種タイムスタンプを指定された形式に変換します。
 
@@ -45,10 +166,14 @@ def convert_timestamp(value: Union[int, float, str], format_type: str) -> str:
             - "JST": 日本時間（YYYY-MM-DD HH:MM:SS）
             - "UNIX": UNIXタイムスタンプ（マイクロ秒）
             - "UNIX_SEC": UNIXタイムスタンプ（秒）
+            - "UNIX_second" / "UNIX_millisecond" / "UNIX_microsecond":
+              UNIX秒/ミリ秒/マイクロ秒として日本時間に変換
             - "MAC": HFS+タイムスタンプ
-            - "WEBKIT": WebKitタイムスタンプ
+            - "WEBKIT" / "CHROME": WebKitタイムスタンプ
+            - "FIREFOX": Firefox（PRTime）タイムスタンプ
             - "FILETIME": Windowsファイルタイム
             - "COCOA": Cocoaタイムスタンプ
+            - タイムゾーン名（"UTC", "GMT", "Asia/Tokyo" など）: 指定したタイムゾーンの時刻
 
     Returns:
         str: 変換後の文字列
@@ -60,44 +185,7 @@ def convert_timestamp(value: Union[int, float, str], format_type: str) -> str:
         >>> convert_timestamp(1704034800000, "UNIX_SEC")
         '1704034800'
     """
-    try:
-        if not isinstance(value, (int, float)):
-            try:
-                value = int(str(value).replace('➡', ''))
-            except (ValueError, TypeError):
-                return str(value)
-
-        if format_type == "JST":
-            return unix_micro_to_jst(value)
-        elif format_type == "UNIX":
-            return str(value)
-        elif format_type == "UNIX_SEC":
-            return str(value // 1000000)  # マイクロ秒から秒に変換
-        elif format_type == "MAC":
-            # HFS+タイムスタンプ（2001年1月1日からの秒数）
-            mac_epoch = datetime(2001, 1, 1, tzinfo=pytz.UTC)
-            seconds = value / 1000000  # マイクロ秒から秒に変換
-            dt = mac_epoch + timedelta(seconds=seconds)
-            return dt.astimezone(pytz.timezone('Asia/Tokyo')).strftime('%Y-%m-%d %H:%M:%S')
-        elif format_type == "WEBKIT":
-            # WebKitタイムスタンプ（1601年1月1日からのマイクロ秒）
-            webkit_epoch = datetime(1601, 1, 1, tzinfo=pytz.UTC)
-            seconds = value / 1000000  # マイクロ秒から秒に変換
-            dt = webkit_epoch + timedelta(seconds=seconds)
-            return dt.astimezone(pytz.timezone('Asia/Tokyo')).strftime('%Y-%m-%d %H:%M:%S')
-        elif format_type == "FILETIME":
-            # Windowsファイルタイム（1601年1月1日からの100ナノ秒単位）
-            filetime_epoch = datetime(1601, 1, 1, tzinfo=pytz.UTC)
-            seconds = (value * 100) / 1000000000  # 100ナノ秒から秒に変換
-            dt = filetime_epoch + timedelta(seconds=seconds)
-            return dt.astimezone(pytz.timezone('Asia/Tokyo')).strftime('%Y-%m-%d %H:%M:%S')
-        elif format_type == "COCOA":
-            # Cocoaタイムスタンプ（2001年1月1日からの秒数）
-            cocoa_epoch = datetime(2001, 1, 1, tzinfo=pytz.UTC)
-            seconds = value / 1000000  # マイクロ秒から秒に変換
-            dt = cocoa_epoch + timedelta(seconds=seconds)
-            return dt.astimezone(pytz.timezone('Asia/Tokyo')).strftime('%Y-%m-%d %H:%M:%S')
-    except Exception as e:
-        return f"変換エラー: {str(e)}"
-    
-    return str(value) 
\ No newline at end of file
+    parsed = parse_timestamp(value)
+    if parsed is None:
+        return str(value)
+    return format_timestamp(parsed, format_type)
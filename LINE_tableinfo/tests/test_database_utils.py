@@ -1,12 +1,26 @@
 import unittest
 import sqlite3
 import os
+import tempfile
 from src.utils.database_utils import (
     connect_database,
     get_all_tables,
     get_table_info,
-    get_table_row_count
+    get_table_xinfo,
+    get_column_samples,
+    get_table_row_count,
+    get_table_contents,
+    get_table_contents_with_wal,
+    build_search_index,
+    search_index,
+    get_table_row_counts,
+    estimate_table_row_counts,
+    load_row_count_cache,
+    save_row_count_cache,
+    get_wal_data,
+    close_wal_connections
 )
+from src.utils import database_utils
 
 class TestDatabaseUtils(unittest.TestCase):
     @classmethod
@@ -46,6 +60,23 @@ class TestDatabaseUtils(unittest.TestCase):
         self.assertIsNotNone(cursor)
         conn.close()
 
+    def test_connect_database_read_only(self):
+        conn, cursor = connect_database(self.test_db, read_only=True)
+        self.assertIsNotNone(conn)
+        cursor.execute("PRAGMA query_only")
+        self.assertEqual(cursor.fetchone()[0], 1)
+        cursor.execute("PRAGMA journal_mode")
+        self.assertEqual(cursor.fetchone()[0], 'delete')
+        # 書き込みは拒否される
+        with self.assertRaises(sqlite3.Error):
+            cursor.execute("INSERT INTO test_table (ZTEXT) VALUES ('x')")
+        conn.close()
+
+        # 存在しないファイルは作成しない
+        conn, cursor = connect_database("missing.db", read_only=True)
+        self.assertIsNone(conn)
+        self.assertFalse(os.path.exists("missing.db"))
+
     def test_get_all_tables(self):
         conn, cursor = connect_database(self.test_db)
         tables = get_all_tables(cursor)
@@ -61,11 +92,152 @@ class TestDatabaseUtils(unittest.TestCase):
         self.assertIn('ZTEXT', column_names)
         conn.close()
 
+    def test_reserved_word_table_name(self):
+        # 予約語や空白を含むテーブル名も引用符で囲んで扱う
+        conn = sqlite3.connect(":memory:")
+        cursor = conn.cursor()
+        cursor.execute('CREATE TABLE "order" (Z_PK INTEGER PRIMARY KEY, ZTEXT TEXT)')
+        cursor.execute('INSERT INTO "order" VALUES (1, \'a\')')
+        self.assertEqual([col[1] for col in get_table_info(cursor, 'order')], ['Z_PK', 'ZTEXT'])
+        self.assertEqual(get_table_row_count(cursor, 'order'), 1)
+        columns, rows, wal_records = get_table_contents_with_wal(cursor, 'order', ":memory:")
+        self.assertEqual((columns, rows), (['Z_PK', 'ZTEXT'], [(1, 'a')]))
+        conn.close()
+
+    def test_get_table_xinfo(self):
+        conn, cursor = connect_database(self.test_db)
+        info = get_table_xinfo(cursor, 'test_table')
+        self.assertEqual([col[1] for col in info], ['Z_PK', 'ZTIMESTAMP', 'ZTEXT'])
+        self.assertEqual(len(info[0]), 7)
+        conn.close()
+
+    def test_get_column_samples(self):
+        conn = sqlite3.connect(":memory:")
+        cursor = conn.cursor()
+        cursor.execute('CREATE TABLE "my table" (ZTIMESTAMP INTEGER, "Z DATE" INTEGER, ZDATA BLOB)')
+        cursor.executemany('INSERT INTO "my table" VALUES (?, ?, ?)',
+                           [(None, 5, b'x' * 1000), (1704034800000, 6, None)])
+        samples = get_column_samples(cursor, 'my table', ['ZTIMESTAMP', 'Z DATE'])
+        # NULLでない最初の値を取得
+        self.assertEqual(samples, {'ZTIMESTAMP': 1704034800000, 'Z DATE': 5})
+        self.assertEqual(get_column_samples(cursor, 'my table', []), {})
+        conn.close()
+
     def test_get_table_row_count(self):
         conn, cursor = connect_database(self.test_db)
         count = get_table_row_count(cursor, 'test_table')
         self.assertEqual(count, 1)
+        # 統計がない場合は COUNT(*) で数える
+        self.assertEqual(get_table_row_count(cursor, 'test_table', estimate=True), 1)
+        # ANALYZE 後は sqlite_stat1 の値を使う
+        cursor.execute("ANALYZE")
+        cursor.execute("UPDATE sqlite_stat1 SET stat = '100 1' WHERE tbl = 'test_table'")
+        self.assertEqual(get_table_row_count(cursor, 'test_table', estimate=True), 100)
+        self.assertEqual(get_table_row_count(cursor, 'test_table'), 1)
         conn.close()
 
+    def test_get_table_contents(self):
+        conn, cursor = connect_database(self.test_db)
+        columns, rows = get_table_contents(cursor, "test_table", start_pk=1, end_pk=10, limit=5)
+        self.assertEqual(columns, ['Z_PK', 'ZTIMESTAMP', 'ZTEXT'])
+        self.assertEqual(rows, [(1, 1704034800000, 'テストメッセージ')])
+
+        # 範囲外
+        _, rows = get_table_contents(cursor, "test_table", start_pk=2, end_pk=10)
+        self.assertEqual(rows, [])
+        conn.close()
+
+    def test_get_table_contents_with_wal(self):
+        conn, cursor = connect_database(self.test_db)
+        # WALファイルがない場合はDBのデータのみ
+        columns, rows, wal_records = get_table_contents_with_wal(cursor, "test_table", self.test_db)
+        self.assertEqual(columns, ['Z_PK', 'ZTIMESTAMP', 'ZTEXT'])
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(wal_records, set())
+        conn.close()
+
+    def test_search_index(self):
+        rows = [
+            (1, 'スタンプを送信しました', None),
+            (2, 'Hello World', 'hello'),
+        ]
+        index = build_search_index(rows, 3)
+        self.assertIsNotNone(index)
+        # 日本語の部分一致・大文字小文字の区別なし
+        self.assertEqual(search_index(index, 'ンプを送'), {0})
+        self.assertEqual(search_index(index, 'HELLO'), {1})
+        # カラム指定
+        self.assertEqual(search_index(index, 'hello', column=2), {1})
+        # 3文字未満はインデックスで検索できない
+        self.assertIsNone(search_index(index, 'he'))
+        index.close()
+
+    def test_get_table_row_counts(self):
+        conn = sqlite3.connect(":memory:")
+        cursor = conn.cursor()
+        cursor.execute('CREATE TABLE "a ""b" (id INTEGER)')
+        cursor.execute("CREATE TABLE c (id INTEGER)")
+        cursor.executemany('INSERT INTO "a ""b" VALUES (?)', [(1,), (5,), (9,)])
+        # 削除された行はmax(rowid)の推定値と異なり、正確な行数に含まれない
+        cursor.execute('DELETE FROM "a ""b" WHERE id = 9')
+        self.assertEqual(get_table_row_counts(cursor, ['a "b', 'c']), {'a "b': 2, 'c': 0})
+        conn.close()
+
+    def test_estimate_table_row_counts(self):
+        conn, cursor = connect_database(self.test_db)
+        counts = estimate_table_row_counts(cursor, ['test_table'])
+        self.assertEqual(counts, {'test_table': 1})
+        conn.close()
+
+        # 空のテーブル・WITHOUT ROWIDのテーブル
+        conn = sqlite3.connect(":memory:")
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE empty_table (id INTEGER)")
+        cursor.execute("CREATE TABLE no_rowid (id INTEGER PRIMARY KEY, v TEXT) WITHOUT ROWID")
+        cursor.executemany("INSERT INTO no_rowid VALUES (?, ?)", [(10, 'a'), (20, 'b')])
+        counts = estimate_table_row_counts(cursor, ['empty_table', 'no_rowid'])
+        self.assertEqual(counts, {'empty_table': 0, 'no_rowid': 2})
+        conn.close()
+
+    def test_row_count_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, 'row_count_cache.json')
+            # ファイルがない場合は空
+            self.assertEqual(load_row_count_cache(cache_path), {})
+
+            cache = {'line.db': {'mtime': 1704034800.5, 'counts': {'ZMESSAGE': 100}, 'exact': []}}
+            save_row_count_cache(cache_path, cache)
+            self.assertEqual(load_row_count_cache(cache_path), cache)
+
+    def test_get_wal_data(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, 'line.db')
+            # WALファイルがない場合は空
+            self.assertEqual(get_wal_data(db_path, 'test_table'), [])
+
+            conn = sqlite3.connect(db_path + '-wal')
+            conn.execute("CREATE TABLE test_table (Z_PK INTEGER PRIMARY KEY, ZTEXT TEXT)")
+            conn.execute("INSERT INTO test_table VALUES (1, 'WALメッセージ')")
+            conn.commit()
+            conn.close()
+
+            self.assertEqual(get_wal_data(db_path, 'test_table'), [(1, 'WALメッセージ')])
+            # 2回目以降は同じ接続を使い回す
+            wal_conn = database_utils._WAL_CONNECTIONS[db_path + '-wal']
+            self.assertEqual(get_wal_data(db_path, 'test_table'), [(1, 'WALメッセージ')])
+            self.assertIs(database_utils._WAL_CONNECTIONS[db_path + '-wal'], wal_conn)
+
+            close_wal_connections()
+            self.assertEqual(database_utils._WAL_CONNECTIONS, {})
+
+    def test_get_wal_data_not_database(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, 'line.db')
+            # SQLiteのデータベースでない-walファイル（WALフレーム形式）は読み込まず、接続も残さない
+            with open(db_path + '-wal', 'wb') as f:
+                f.write(b'\x37\x7f\x06\x82' + b'\x00' * 4092)
+            self.assertEqual(get_wal_data(db_path, 'test_table'), [])
+            self.assertNotIn(db_path + '-wal', database_utils._WAL_CONNECTIONS)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
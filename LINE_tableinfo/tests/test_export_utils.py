@@ -0,0 +1,51 @@
+import unittest
+import sqlite3
+import os
+import shutil
+import tempfile
+import zipfile
+from src.utils.export_utils import export_to_excel
+
+class TestExportUtils(unittest.TestCase):
+    def setUp(self):
+        # 出力先（exports/）をテスト用の一時ディレクトリに作成
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+        self.conn = sqlite3.connect(":memory:")
+        self.cursor = self.conn.cursor()
+        self.cursor.execute("CREATE TABLE test_table (Z_PK INTEGER, ZTEXT TEXT, ZDATA BLOB)")
+
+    def tearDown(self):
+        self.conn.close()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_export_to_excel(self):
+        self.cursor.executemany(
+            "INSERT INTO test_table VALUES (?, ?, ?)",
+            [(i, f'メッセージ{i}', b'\x01\xff') for i in range(25)]
+        )
+        progress = []
+        excel_file = export_to_excel(self.cursor, 'test_table', progress_callback=progress.append)
+        self.assertIsNotNone(excel_file)
+        self.assertTrue(os.path.exists(excel_file))
+
+        with zipfile.ZipFile(excel_file) as xlsx:
+            strings = xlsx.read('xl/sharedStrings.xml').decode('utf-8') \
+                if 'xl/sharedStrings.xml' in xlsx.namelist() else ''
+            sheet = xlsx.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        content = strings + sheet
+        self.assertIn('ZTEXT', content)
+        self.assertIn('メッセージ24', content)
+        # BLOBは16進数文字列として出力
+        self.assertIn('01ff', content)
+        # 行数が間隔未満の場合は進捗を通知しない
+        self.assertEqual(progress, [])
+
+    def test_export_empty_table(self):
+        self.assertIsNone(export_to_excel(self.cursor, 'test_table'))
+
+if __name__ == '__main__':
+    unittest.main()
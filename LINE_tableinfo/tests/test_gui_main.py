@@ -0,0 +1,115 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+from collections import OrderedDict
+from src.gui.gui_main import LineDBViewer
+
+class TestDetailView(unittest.TestCase):
+    def setUp(self):
+        # ウィンドウを作成せず、クリック時の値の取得と詳細表示の作成のみを確認する
+        self.viewer = LineDBViewer.__new__(LineDBViewer)
+        self.viewer.current_data = [(42, 3.5, None, 'テキスト')]
+        self.viewer.current_columns = ['ZCOUNT', 'ZRATE', 'ZEMPTY', 'ZTEXT']
+        self.viewer.time_display_modes = {}
+        self.viewer._ts_cols = set()
+        self.viewer._ts_col_indices = []
+        self.viewer._window_cache = OrderedDict()
+
+    def test_extended_detail_of_clicked_cell(self):
+        row = self.viewer._get_display_row(0)
+        expected = (('number', '値: 42\n'), ('number', '値: 3.5\n'), ('null', '値: NULL\n'), ('text', '文字数: 4\n'))
+        for col_num, (data_type, text) in enumerate(expected):
+            column_name = self.viewer.current_columns[col_num]
+            value = row[col_num]
+            self.assertEqual(self.viewer._detect_data_type(column_name, value), data_type)
+            segments = self.viewer._extended_detail_segments(value, data_type)
+            # 整数・実数・NULLでも解析エラーにならない
+            self.assertNotIn('error', [tag for _, tag in segments])
+            self.assertIn(text, [segment for segment, _ in segments])
+
+class TagRecorder:
+    """tag_configure の呼び出し順を記録する（ウィンドウを作成せずにタグの設定順を確認する）"""
+    def __init__(self):
+        self.tags = []
+
+    def tag_configure(self, tag, **options):
+        self.tags.append(tag)
+
+class TestTreeTags(unittest.TestCase):
+    def test_highlight_tags_created_before_row_stripes(self):
+        # ttk::treeview では先に作成したタグが優先されるため、行の背景色は最後に作成する
+        viewer = LineDBViewer.__new__(LineDBViewer)
+        viewer.tree = TagRecorder()
+        viewer._configure_tree_tags()
+        order = viewer.tree.tags
+        for highlight in ('search_result', 'selected_row', 'selected_cell'):
+            self.assertLess(order.index(highlight), order.index('evenrow'))
+            self.assertLess(order.index(highlight), order.index('oddrow'))
+
+    def test_selected_row_tags(self):
+        # 選択した行は背景色のタグ（行の背景色・検索結果）を外し、WALレコードの文字色は維持する
+        wal_search_row = LineDBViewer.ROW_TAG_SETS[1 | 2 | 4]
+        self.assertEqual(LineDBViewer._selected_row_tags(wal_search_row),
+                         ('selected_row', 'selected_cell', 'wal_record'))
+        self.assertEqual(LineDBViewer._selected_row_tags(LineDBViewer.ROW_TAG_SETS[4]),
+                         ('selected_row', 'selected_cell'))
+
+class TestRowCount(unittest.TestCase):
+    def test_count_all_table_rows_in_batches(self):
+        viewer = LineDBViewer.__new__(LineDBViewer)
+        conn = sqlite3.connect(":memory:")
+        for i, table in enumerate(['A', 'B', 'C']):
+            conn.execute(f"CREATE TABLE {table} (x)")
+            conn.executemany(f"INSERT INTO {table} VALUES (?)", [(j,) for j in range(i + 1)])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            viewer.ROW_COUNT_CACHE_PATH = os.path.join(temp_dir, 'row_count_cache.json')
+            viewer.current_db_path = viewer._opened_db_path = 'line.db'
+            viewer.cursor = conn.cursor()
+            # Bはテーブル選択時に数え終わっている
+            viewer._row_count_cache = {'line.db': {'mtime': 0, 'counts': {'A': 9, 'B': 2, 'C': 9}, 'exact': ['B']}}
+
+            # 指定したテーブルのみ数え、数え終わったテーブルは数え直さない
+            self.assertEqual(viewer._count_all_table_rows('line.db', ['A', 'B']), {'A': 1})
+            self.assertEqual(viewer._count_all_table_rows('line.db', ['C']), {'C': 3})
+            entry = viewer._row_count_cache['line.db']
+            self.assertEqual(entry['counts'], {'A': 1, 'B': 2, 'C': 3})
+            self.assertEqual(sorted(entry['exact']), ['A', 'B', 'C'])
+            # 別のDBを開いた後は何もしない
+            self.assertEqual(viewer._count_all_table_rows('other.db', ['A']), {})
+        conn.close()
+
+    def test_count_after_opening_another_db(self):
+        viewer = LineDBViewer.__new__(LineDBViewer)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            viewer.ROW_COUNT_CACHE_PATH = os.path.join(temp_dir, 'row_count_cache.json')
+            viewer._row_count_cache = {}
+            viewer._db_finalizer = None
+            db_paths = []
+            for name, rows in (('db1.db', 1), ('db2.db', 5)):
+                db_path = os.path.join(temp_dir, name)
+                conn = sqlite3.connect(db_path)
+                conn.execute("CREATE TABLE ZMESSAGE (x)")
+                conn.executemany("INSERT INTO ZMESSAGE VALUES (?)", [(j,) for j in range(rows)])
+                conn.commit()
+                conn.close()
+                db_paths.append(db_path)
+            db1, db2 = db_paths
+
+            viewer._open_database(db1)
+            viewer.current_db_path = db1
+            # ワーカースレッドでDB2を開いた直後（メインスレッドの current_db_path はまだDB1）
+            viewer._open_database(db2)
+            self.assertEqual(viewer.current_db_path, db1)
+
+            # DB1向けの集計は、DB2の行数をDB1のキャッシュに書き込まない
+            self.assertEqual(viewer._count_all_table_rows(db1, ['ZMESSAGE']), {})
+            self.assertEqual(viewer._row_count_cache[db1]['exact'], [])
+            # テーブル選択時の集計は、開いているDB2のキャッシュを更新する
+            self.assertEqual(viewer._count_table_rows('ZMESSAGE'), 5)
+            self.assertEqual(viewer._row_count_cache[db2]['exact'], ['ZMESSAGE'])
+            self.assertEqual(viewer._row_count_cache[db1]['exact'], [])
+            viewer._db_finalizer()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from src.utils.hex_utils import hex_dump_lines
+
+class TestHexUtils(unittest.TestCase):
+    def test_hex_dump_lines(self):
+        data = bytes(range(0x41, 0x41 + 16)) + b'\x00\xff\n'
+        lines = hex_dump_lines(data)
+        self.assertEqual(len(lines), 2)
+
+        # 1行目（8バイトごとに空白を追加）
+        offset, hex_line, ascii_line = lines[0]
+        self.assertEqual(offset, 0)
+        self.assertEqual(hex_line, "41 42 43 44 45 46 47 48  49 4A 4B 4C 4D 4E 4F 50")
+        self.assertEqual(ascii_line, "ABCDEFGHIJKLMNOP")
+
+        # 2行目（表示できない文字は "."、16進数部分は1行目と同じ48文字に揃える）
+        offset, hex_line, ascii_line = lines[1]
+        self.assertEqual(offset, 16)
+        self.assertEqual(hex_line, "00 FF 0A".ljust(48))
+        self.assertEqual(len(hex_line), len(lines[0][1]))
+        self.assertEqual(ascii_line, "...")
+
+    def test_hex_dump_lines_start_offset(self):
+        # データの途中から変換した場合も元データでのオフセットを表示
+        lines = hex_dump_lines(b'LINE' * 8, start_offset=0x100)
+        self.assertEqual([line[0] for line in lines], [0x100, 0x110])
+        self.assertEqual(lines[1][2], "LINELINELINELINE")
+
+    def test_hex_dump_lines_empty(self):
+        self.assertEqual(hex_dump_lines(b''), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+from src.utils.image_utils import detect_image_type
+
+class TestImageUtils(unittest.TestCase):
+    def test_detect_image_type(self):
+        self.assertEqual(detect_image_type(b'\xff\xd8\xff\xe0' + b'\x00' * 16), 'JPEG')
+        self.assertEqual(detect_image_type(b'\x89PNG\r\n\x1a\n' + b'\x00' * 16), 'PNG')
+        self.assertEqual(detect_image_type(b'GIF89a' + b'\x00' * 16), 'GIF(GIF89a)')
+        self.assertEqual(detect_image_type(b'MM\x00*' + b'\x00' * 16), 'TIFF')
+        self.assertEqual(detect_image_type(b'RIFF\x24\x00\x00\x00WEBPVP8 ' + b'\x00' * 16), 'Webp')
+
+    def test_detect_image_type_riff(self):
+        # WebP以外のRIFFコンテナ（WAV, AVI）は画像として扱わない
+        self.assertIsNone(detect_image_type(b'RIFF\x24\x00\x00\x00WAVEfmt ' + b'\x00' * 16))
+        self.assertIsNone(detect_image_type(b'RIFF\x24\x00\x00\x00AVI LIST' + b'\x00' * 16))
+        # 形式名まで届かない短いデータ
+        self.assertIsNone(detect_image_type(b'RIFF\x24\x00'))
+
+    def test_detect_image_type_not_image(self):
+        self.assertIsNone(detect_image_type(b''))
+        self.assertIsNone(detect_image_type(b'bplist00'))
+        # 先頭以外にあるシグネチャは判定しない
+        self.assertIsNone(detect_image_type(b'\x00\x00' + b'\x89PNG\r\n\x1a\n'))
+
+if __name__ == '__main__':
+    unittest.main()
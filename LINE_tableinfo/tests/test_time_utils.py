@@ -1,5 +1,5 @@
 import unittest
-from src.utils.time_utils import unix_micro_to_jst, convert_timestamp
+from src.utils.time_utils import unix_micro_to_jst, convert_timestamp, convert_timestamps, parse_timestamp, format_timestamp
 
 class TestTimeUtils(unittest.TestCase):
     def test_unix_micro_to_jst(self):
@@ -25,5 +25,28 @@ class TestTimeUtils(unittest.TestCase):
         unix_sec_result = convert_timestamp(timestamp, "UNIX_SEC")
         self.assertEqual(unix_sec_result, str(timestamp // 1000000))
 
+    def test_parse_timestamp(self):
+        self.assertEqual(parse_timestamp("1704034800000"), 1704034800000)
+        self.assertEqual(parse_timestamp("➡1704034800000"), 1704034800000)
+        self.assertEqual(parse_timestamp(1704034800000), 1704034800000)
+        self.assertIsNone(parse_timestamp("2024-01-01 00:00:00"))
+        self.assertIsNone(parse_timestamp(None))
+
+    def test_format_timestamp(self):
+        parsed = parse_timestamp("1704034800000")
+        self.assertEqual(format_timestamp(parsed, "UNIX_millisecond"), "2024-01-01 00:00:00")
+        self.assertEqual(format_timestamp(1704034800, "UNIX_second"), "2024-01-01 00:00:00")
+        self.assertEqual(format_timestamp(parsed, "UTC"), "2023-12-31 15:00:00")
+        self.assertEqual(format_timestamp(parsed, "Asia/Tokyo"), "2024-01-01 00:00:00")
+        # 未対応の形式は数値をそのまま返す
+        self.assertEqual(format_timestamp(parsed, "UNKNOWN"), "1704034800000")
+
+    def test_convert_timestamps(self):
+        values = [1704034800000, None, "➡1704034800000", "テキスト"]
+        for format_type in ("JST", "UNIX_SEC", "MAC", "UTC"):
+            # 1件ずつ変換した場合と同じ結果（NULLはそのまま）
+            expected = [None if v is None else convert_timestamp(v, format_type) for v in values]
+            self.assertEqual(convert_timestamps(values, format_type), expected)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file